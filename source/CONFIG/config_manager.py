@@ -1,9 +1,13 @@
+import functools
+
 from utils import load_config
 
 
 class ConfigManager:
     def __init__(self, config_path):
         self.config = load_config(config_path)
+        # Sections are read-only after load, so memoize lookups per instance
+        self.get_config = functools.lru_cache(maxsize=32)(self._get_config)
 
-    def get_config(self, key):
+    def _get_config(self, key):
         return self.config.get(key, None)
@@ -11,6 +11,8 @@ from audio.audio_recorder import AudioRecorder
 from audio.audio_player import AudioPlayer
 import numpy as np
 import os
+import threading
+from utils import float32_to_pcm16
 
 
 class AudioManager:
@@ -25,6 +27,8 @@ class AudioManager:
         config_manager: An instance of a configuration manager to handle application settings.
         audio_recorder: The AudioRecorder object to manage audio recording.
         audio_player: The AudioPlayer object to manage audio playback.
+        audio_folder (str): The directory path where audio files are stored.
+        _save_thread (threading.Thread): The background thread writing the last recording to disk, if any.
     """
 
     def __init__(self, config_manager):
@@ -35,19 +39,29 @@ class AudioManager:
             config_manager: An instance of the configuration manager which provides settings for the audio components.
         """
         self.config_manager = config_manager
+        self.audio_folder = self.config_manager.get_config("files")["audio"]
         self.audio_recorder = AudioRecorder(config_manager)
         self.audio_player = AudioPlayer()
+        self._save_thread = None
 
-    def load_sounds(self):
+    def load_sounds(self, morphed_audio=None):
         """
         Loads the audio files into the audio player in preparation for playback.
+
+        Parameters:
+            morphed_audio (dict, optional): Maps file names to morphed samples already in memory, so they are not read back from disk.
         """
-        self.audio_player.load_sounds()
+        preloaded = dict(morphed_audio or {})
+        preloaded["recorded_audio.npy"] = self.get_recorded_audio()
+        self.audio_player.load_sounds(preloaded)
 
     def toggle_recording(self):
         """
         Toggles the audio recording state between recording and not recording.
         """
+        if not self.audio_recorder.is_recording:
+            # The recorder reuses its buffer, so the previous save must finish first
+            self.wait_for_saved_audio()
         self.audio_recorder.toggle_recording()
 
     def play(self):
@@ -68,13 +82,28 @@ class AudioManager:
         """
         self.audio_player.clear_sounds()
 
+    def close(self):
+        """
+        Closes the audio player's output stream.
+        """
+        self.audio_player.close()
+
     def play_recorded_audio(self):
         """
         Loads and plays the audio that was most recently recorded.
         """
-        self.audio_player.load_sound("recorded_audio.npy")
+        self.audio_player.load_sound("recorded_audio.npy", self.get_recorded_audio())
         self.audio_player.play_sound("recorded_audio.npy")
 
+    def get_recorded_audio(self):
+        """
+        Returns the most recently recorded audio, straight from the recorder's buffer.
+
+        Returns:
+            np.ndarray: The recorded audio samples.
+        """
+        return self.audio_recorder.get_recorded_audio()
+
     def get_recorded_audio_path(self):
         """
         Constructs and returns the file path for the recorded audio file.
@@ -82,13 +111,39 @@ class AudioManager:
         Returns:
             str: The full file path of the recorded audio.
         """
-        audio_folder = self.config_manager.get_config("files")["audio"]
-        audio_file = os.path.join(audio_folder, "recorded_audio.npy")
+        audio_file = os.path.join(self.audio_folder, "recorded_audio.npy")
         return audio_file
 
     def save_recorded_audio(self):
         """
-        Saves the audio recorded by the AudioRecorder into a .npy file.
+        Saves the audio recorded by the AudioRecorder into a .npy file of int16 PCM samples, half the size of the float32 recording.
+
+        The file is written on a background thread so playback can start right away; call wait_for_saved_audio before reading it back.
         """
         recorded_audio_path = self.get_recorded_audio_path()
-        np.save(recorded_audio_path, self.audio_recorder.get_recorded_audio())
+        self._save_thread = threading.Thread(
+            target=self._write_npy,
+            args=(recorded_audio_path, self.get_recorded_audio()),
+            daemon=True,
+        )
+        self._save_thread.start()
+
+    @staticmethod
+    def _write_npy(path, audio):
+        """
+        Quantizes the audio to int16 PCM and writes it to a .npy file, streaming the contiguous buffer straight to disk.
+
+        Parameters:
+            path (str): The file path to write.
+            audio (np.ndarray): The float32 audio samples.
+        """
+        with open(path, "wb") as file:
+            np.lib.format.write_array(file, float32_to_pcm16(audio), allow_pickle=False)
+
+    def wait_for_saved_audio(self):
+        """
+        Blocks until the last recording has been written to disk.
+        """
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
@@ -1,17 +1,26 @@
 """
 audio_player.py
 
-This module defines the AudioPlayer class for the audio application. It includes logic for loading, playing, pausing, stopping, and morphing sounds using the pygame mixer. The AudioPlayer class interacts with file system components and pygame library to orchestrate the core functionalities of audio manipulation.
+This module defines the AudioPlayer class for the audio application. It includes logic for loading, playing, pausing, stopping, and morphing sounds through a NumPy streaming mixer. The AudioPlayer class interacts with file system components and the StreamMixer to orchestrate the core functionalities of audio manipulation.
 
 Classes:
     AudioPlayer: Handles the loading, playing, and morphing of audio files.
 """
 
-import pygame
 import numpy as np
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from queue import Empty
-from utils import load_config, CONFIG_PATH
+from audio.stream_mixer import StreamMixer
+from utils import load_config, CONFIG_PATH, pcm16_to_float32
+
+# Cross-fade duration used when morphing between sounds
+CROSSFADE_MS = 50
+
+# Special morphing queue messages
+NO_ACTION_MESSAGE = 4
+STOP_MESSAGE = -1
 
 
 class AudioPlayer:
@@ -22,12 +31,17 @@ class AudioPlayer:
         config (dict): Configuration settings for the player, loaded from a file.
         audio_folder (str): The directory path where audio files are stored.
         loops (int): Number of times to loop the audio.
-        sounds (dict): A dictionary of loaded pygame Sound objects.
+        sounds (dict): A dictionary of loaded sounds as mono float32 arrays.
+        mixer (StreamMixer): The streaming mixer that plays the sounds.
         sound_to_mute (int): Index of the sound that will be muted during morphing.
+        _sound_order (list): Sorted sound file names, indexed by morphing message.
+        _name_to_index (dict): Maps each sound file name to its index in _sound_order.
+        _first_sound_name (str): The first sound loaded since the last clear, which starts audible when morphing.
 
     Methods:
         load_sound: Loads a single sound file.
         load_sounds: Loads all sound files from the audio directory.
+        invalidate_sound_order: Forces the next load to rescan the audio directory.
         play_sound: Plays a specific sound file.
         play_all_sounds: Plays all loaded sounds.
         stop_sound: Stops a specific sound file.
@@ -36,7 +50,9 @@ class AudioPlayer:
         unpause_all_sounds: Unpauses all sounds.
         clear_sounds: Clears all loaded sounds from memory.
         start_morphing: Begins the audio morphing process.
+        close: Closes the mixer's output stream.
         _process_message: Processes a message from the morphing queue.
+        _crossfade: Performs an equal-power cross-fade between two sounds.
     """
 
     def __init__(self):
@@ -47,31 +63,92 @@ class AudioPlayer:
         self.config = load_config(CONFIG_PATH)
         self.audio_folder = self.config["files"]["audio"]
         self.loops = self.config["morphing"]["loops"]
-        pygame.mixer.init(frequency=22050, size=32)
+        self.mixer = StreamMixer(self.config["controller"]["sr"])
 
         # Initialize variables
         self.sounds = {}
         self.sound_to_mute = 0
-
-    def load_sound(self, file_name):
+        self._sound_order = []
+        self._name_to_index = {}
+        self._first_sound_name = None
+        self._sounds_lock = threading.Lock()
+        self._is_morphing = False
+        self._message_handlers = {
+            NO_ACTION_MESSAGE: self._ignore_message,
+            STOP_MESSAGE: self._stop_morphing,
+        }
+
+    def load_sound(self, file_name, audio=None):
         """
-        Loads a single sound file and converts it into a pygame Sound object.
+        Loads a single sound file into memory as a mono float32 array.
 
         Parameters:
             file_name (str): The name of the audio file to load.
+            audio (np.ndarray, optional): Samples already in memory. When given, the file is not read from disk.
+        """
+        sound = self._read_sound(file_name, audio)
+        with self._sounds_lock:
+            if not self.sounds:
+                self._first_sound_name = file_name
+            self.sounds[file_name] = sound
+
+    def _read_sound(self, file_name, audio=None):
         """
-        # Load a single sound and convert it to a pygame Sound object
-        audio = np.load(os.path.join(self.audio_folder, file_name))
-        sound = pygame.mixer.Sound(audio)
-        self.sounds[file_name] = sound
+        Builds the mixer-ready samples of a sound, reading the audio file only if no samples are given.
 
-    def load_sounds(self):
+        Parameters:
+            file_name (str): The name of the audio file to read.
+            audio (np.ndarray, optional): Samples already in memory.
+
+        Returns:
+            np.ndarray: The sound as a mono float32 array.
         """
-        Loads all sound files from the audio directory into pygame Sound objects.
+        if audio is None:
+            # Memory-map the file and copy it in a single pass, so the
+            # mapping is released on return
+            audio = np.load(os.path.join(self.audio_folder, file_name), mmap_mode="r")
+        # The recording is stored as int16 PCM, the morphed sounds as float32
+        return pcm16_to_float32(audio).ravel()
+
+    def load_sounds(self, preloaded=None):
         """
-        # Load multiple sounds and convert them to pygame Sound objects
-        for file_name in sorted(os.listdir(self.audio_folder)):
-            self.load_sound(file_name)
+        Loads all sound files from the audio directory into memory.
+
+        Parameters:
+            preloaded (dict, optional): Maps file names to samples already in memory; those files are not read from disk.
+        """
+        # Load multiple sounds as mixer-ready arrays
+        if not self._sound_order:
+            self._scan_sound_order()
+        preloaded = preloaded or {}
+        in_memory = [preloaded.get(file_name) for file_name in self._sound_order]
+        # Files are independent and loading is I/O-bound, so overlap the reads;
+        # results are stored in sorted order to keep the sounds dict deterministic
+        max_workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = list(executor.map(self._read_sound, self._sound_order, in_memory))
+        with self._sounds_lock:
+            if not self.sounds and self._sound_order:
+                self._first_sound_name = self._sound_order[0]
+            self.sounds.update(zip(self._sound_order, loaded))
+
+    def _scan_sound_order(self):
+        """
+        Lists the audio directory once and caches the sorted file names and their indexes.
+        """
+        self._sound_order = sorted(os.listdir(self.audio_folder))
+        self._name_to_index = {
+            file_name: index for index, file_name in enumerate(self._sound_order)
+        }
+
+    def invalidate_sound_order(self):
+        """
+        Drops the cached directory listing so the next load_sounds rescans the audio directory.
+
+        Call this when the set of morph targets changes, e.g. after changing the configured models.
+        """
+        self._sound_order = []
+        self._name_to_index = {}
 
     def play_sound(self, file_name, loops=0):
         """
@@ -83,8 +160,8 @@ class AudioPlayer:
         """
         # Play a single sound
         sound = self.sounds.get(file_name)
-        if sound:
-            sound.play(loops=loops)
+        if sound is not None:
+            self.mixer.play(file_name, sound, loops=loops)
 
     def play_all_sounds(self, loops=0):
         """
@@ -93,16 +170,15 @@ class AudioPlayer:
         Parameters:
             loops (int): The number of times to loop the sounds. Default is 0 (no loop).
         """
-        # Play all loaded sounds at volume 0.0, will be adjusted during morphing
-        for sound in self.sounds.values():
-            sound.play(loops=loops)
-            sound.set_volume(0.0)
+        # Play all loaded sounds at volume 0.0, except the first one which
+        # starts at 1.0; volumes are adjusted during morphing
+        first_sound_name = self._first_sound_name
+        for file_name, sound in self.sounds.items():
+            gain = 1.0 if file_name == first_sound_name else 0.0
+            self.mixer.play(file_name, sound, loops=loops, gain=gain)
 
-        # Set the volume of the first sound to 1.0 to start the morphing
-        first_sound = next(iter(self.sounds.values()), None)
-        if first_sound:
-            first_sound.set_volume(1.0)
-            self.sound_to_mute = list(self.sounds.keys())[0]
+        if first_sound_name:
+            self.sound_to_mute = self._name_to_index.get(first_sound_name, 0)
 
     def stop_sound(self, file_name):
         """
@@ -112,16 +188,14 @@ class AudioPlayer:
             file_name (str): The name of the sound file to stop.
         """
         # Stop a single sound
-        sound = self.sounds.get(file_name)
-        if sound:
-            sound.stop()
+        self.mixer.stop(file_name)
 
     def stop_all_sounds(self):
         """
         Stops all sounds from playing.
         """
         # Stop all sounds
-        pygame.mixer.stop()
+        self.mixer.stop_all()
 
     def pause_all_sounds(self):
         """
@@ -129,7 +203,7 @@ class AudioPlayer:
         """
         # Pause all sounds
         if self.sounds:
-            pygame.mixer.pause()
+            self.mixer.pause()
 
     def unpause_all_sounds(self):
         """
@@ -137,15 +211,25 @@ class AudioPlayer:
         """
         # Unpause all sounds
         if self.sounds:
-            pygame.mixer.unpause()
+            self.mixer.unpause()
 
     def clear_sounds(self):
         """
         Stops all sounds and removes them from the internal dictionary.
+
+        The cached directory listing is kept, since every session writes the same morph target files.
         """
         # Stop all sounds and clear them from the dictionary
         self.stop_all_sounds()
         self.sounds.clear()
+        self._first_sound_name = None
+
+    def close(self):
+        """
+        Stops all sounds and closes the mixer's output stream.
+        """
+        self.stop_all_sounds()
+        self.mixer.close()
 
     def start_morphing(self, thread_manager, stop_event):
         """
@@ -158,22 +242,43 @@ class AudioPlayer:
 
         morphing_queue = thread_manager.get_queue("morphing_data")
         self.play_all_sounds(loops=self.loops)
+        self._is_morphing = True
 
-        while not stop_event.is_set():
+        # Bind the per-message lookups once, outside the loop
+        get_message = morphing_queue.get
+        get_handler = self._message_handlers.get
+        process_message = self._process_message
+        is_stopped = stop_event.is_set
+
+        while self._is_morphing and not is_stopped():
             try:
-                message = morphing_queue.get(timeout=1)  # Use timeout to avoid blocking
+                # get() wakes as soon as a message is put; the timeout only
+                # bounds how long a stop request can go unnoticed
+                message = get_message(timeout=1)
             except Empty:
                 continue  # Continue the loop if no message is received
 
-            if message == 4:
-                continue
-            elif message != -1:  # -1 could be the message to stop morphing
-                self._process_message(message)
-            else:
-                break
+            get_handler(message, process_message)(message)
 
         self.stop_all_sounds()
 
+    def _ignore_message(self, message):
+        """
+        Ignores a morphing message that requires no transition, such as the 'no action' pose.
+
+        Parameters:
+            message (int): The ignored message.
+        """
+
+    def _stop_morphing(self, message):
+        """
+        Ends the morphing loop after a stop message.
+
+        Parameters:
+            message (int): The stop message.
+        """
+        self._is_morphing = False
+
     def _process_message(self, message):
         """
         Handles a message from the morphing queue to transition sound volume levels.
@@ -182,14 +287,25 @@ class AudioPlayer:
             message (int): The index of the sound to activate.
         """
         sound_to_activate = message
-        current_sound = self.sounds.get(self.sound_to_mute)
+        current_sound_name = self._sound_order[self.sound_to_mute]
+        new_sound_name = self._sound_order[sound_to_activate]
 
-        if current_sound:
-            current_sound.set_volume(0.0)  # Mute the current sound
+        if current_sound_name == new_sound_name:
+            self.mixer.set_gain(new_sound_name, 1.0)
+        else:
+            self._crossfade(current_sound_name, new_sound_name)
 
-        new_sound_name = sorted(list(self.sounds.keys()))[sound_to_activate]
-        new_sound = self.sounds.get(new_sound_name)
-        if new_sound:
-            new_sound.set_volume(1.0)  # Max volume for the new sound
+        self.sound_to_mute = sound_to_activate
 
-        self.sound_to_mute = new_sound_name
+    def _crossfade(self, old_sound_name, new_sound_name, duration_ms=CROSSFADE_MS):
+        """
+        Ramps the old sound down and the new sound up along an equal-power curve, avoiding the click of a hard switch.
+
+        The ramp is applied sample by sample inside the mixer, so this returns immediately.
+
+        Parameters:
+            old_sound_name (str): The name of the sound to fade out.
+            new_sound_name (str): The name of the sound to fade in.
+            duration_ms (int): The length of the cross-fade in milliseconds.
+        """
+        self.mixer.crossfade(old_sound_name, new_sound_name, duration_ms)
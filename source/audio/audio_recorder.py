@@ -7,7 +7,6 @@ Classes:
     AudioRecorder: Handles the initialization and control of audio recording sessions.
 """
 
-import numpy as np
 from audio.recorder import Recorder
 
 
@@ -20,12 +19,11 @@ class AudioRecorder:
     Attributes:
         recorder (Recorder): A Recorder instance for handling the low-level recording functionality.
         config_manager: The configuration manager providing recording parameters.
-        recorded_audio (np.ndarray): A buffer to hold the recorded audio data.
         is_recording (bool): A flag indicating if recording is currently active.
         start_time (float): The timestamp when recording started.
 
     Methods:
-        init_variables: Initializes recording variables based on configuration.
+        init_variables: Initializes the recording state.
         toggle_recording: Starts or stops the recording process.
         get_recorded_audio: Returns the recorded audio buffer.
     """
@@ -37,18 +35,15 @@ class AudioRecorder:
         Parameters:
             config_manager: The manager that provides configuration such as sample rate and max duration.
         """
-        self.recorder = Recorder()
         self.config_manager = config_manager
+        max_duration = self.config_manager.get_config("controller")["max_duration"]
+        self.recorder = Recorder(max_duration)
         self.init_variables()
 
     def init_variables(self):
         """
-        Initializes recording variables from configuration manager.
+        Initializes the recording state. The audio buffer itself is owned by the recorder.
         """
-        config = self.config_manager.get_config("controller")
-        max_duration = config["max_duration"]
-        sr = config["sr"]
-        self.recorded_audio = np.zeros((sr * max_duration, 1), np.float32)
         self.is_recording = False
 
     def toggle_recording(self):
@@ -61,13 +56,12 @@ class AudioRecorder:
         else:
             self.is_recording = False
             self.recorder.stop_recording(self.start_time)
-            self.recorded_audio = self.recorder.get_recorded_audio()
 
     def get_recorded_audio(self):
         """
         Retrieves the recorded audio buffer.
 
         Returns:
-            np.ndarray: A buffer containing the recorded audio data.
+            np.ndarray: A buffer containing the recorded audio data, empty before the first recording.
         """
-        return self.recorded_audio
+        return self.recorder.get_recorded_audio()
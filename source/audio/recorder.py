@@ -18,7 +18,7 @@ class Recorder:
 
     Attributes:
         max_duration (int): Maximum duration in seconds that the recorder can capture.
-        recorded_audio (np.ndarray): Array that stores the recorded audio data.
+        recorded_audio (np.ndarray): Preallocated array that stores the recorded audio data, reused across recordings.
         RECORDING_SR (int): Sampling rate for the audio recording.
 
     Methods:
@@ -37,9 +37,9 @@ class Recorder:
             max_duration (int): The maximum duration in seconds for the recording.
         """
         self.max_duration = max_duration
-        self.recorded_audio = np.zeros(
-            (int(self.RECORDING_SR * self.max_duration), 1), dtype=np.float32
-        )
+        self._capacity = int(self.RECORDING_SR * self.max_duration)
+        self._valid = 0
+        self.recorded_audio = np.zeros((self._capacity, 1), dtype=np.float32)
 
     def start_recording(self, blocksize=1024):
         """
@@ -51,9 +51,10 @@ class Recorder:
         Returns:
             float: The start time of the recording.
         """
+        self._valid = 0
         start_time = time.time()
         sd.rec(
-            frames=int(self.RECORDING_SR * self.max_duration),
+            frames=self._capacity,
             samplerate=self.RECORDING_SR,
             channels=1,
             dtype=np.float32,
@@ -65,7 +66,9 @@ class Recorder:
 
     def stop_recording(self, start_time):
         """
-        Stops the recording of audio data and trims the recorded_audio buffer to the length of the actual recording.
+        Stops the recording of audio data and marks how much of the recorded_audio buffer holds the actual recording.
+
+        The buffer itself is kept at full capacity so the next recording can reuse it.
 
         Parameters:
             start_time (float): The start time of the recording to calculate the total recorded duration.
@@ -73,7 +76,7 @@ class Recorder:
         sd.stop()
         total_time = time.time() - start_time
         samples_to_keep = int(min(total_time, self.max_duration) * self.RECORDING_SR)
-        self.recorded_audio = self.recorded_audio[:samples_to_keep, :]
+        self._valid = min(samples_to_keep, self._capacity)
         print("RECORDING STOPPED")
 
     def get_recorded_audio(self):
@@ -81,6 +84,6 @@ class Recorder:
         Retrieves the recorded audio data.
 
         Returns:
-            np.ndarray: The array containing the recorded audio data up to the maximum duration.
+            np.ndarray: A view of the recorded audio data, trimmed to the length of the last recording.
         """
-        return self.recorded_audio
+        return self.recorded_audio[: self._valid]
@@ -0,0 +1,265 @@
+"""
+stream_mixer.py
+
+This module defines the StreamMixer class for the audio application. It includes logic for mixing several looping voices into a single sounddevice output stream, blending them with NumPy and ramping their gains sample by sample. The StreamMixer replaces a per-sound mixer channel setup, so that muted voices only advance their play position instead of being mixed.
+
+Classes:
+    Voice: Holds the samples, play position, loop count, and gain envelope of a single playing sound.
+    StreamMixer: Mixes the playing voices into a sounddevice output stream.
+"""
+
+import threading
+
+import numpy as np
+import sounddevice as sd
+
+HALF_PI = np.pi / 2
+
+
+class Voice:
+    """
+    Holds the state of a single playing sound.
+
+    The gain is stored as an angle in [0, pi/2] and applied as its sine, so that two voices ramping in opposite directions at the same rate form an equal-power cross-fade.
+
+    Attributes:
+        samples (np.ndarray): The mono float32 samples of the sound.
+        position (int): The index of the next sample to play.
+        loops (int): The remaining number of repeats; -1 loops forever.
+        angle (float): The current gain angle.
+        target_angle (float): The gain angle the voice is ramping towards.
+        angle_step (float): The per-sample change of the gain angle while ramping.
+        finished (bool): Whether the voice has played all its repeats.
+
+    Methods:
+        set_gain: Sets the target gain, optionally reached through a ramp.
+        mix_into: Adds the next block of samples, scaled by the gain envelope, to an output buffer.
+        _envelope: Computes the gain for the next block of samples.
+    """
+
+    def __init__(self, samples, loops=0, gain=1.0):
+        """
+        Initializes the Voice at the start of its samples.
+
+        Parameters:
+            samples (np.ndarray): The mono float32 samples of the sound.
+            loops (int): The number of extra repeats; -1 loops forever.
+            gain (float): The initial gain in [0.0, 1.0].
+        """
+        self.samples = samples
+        self.position = 0
+        self.loops = loops
+        self.angle = self.target_angle = float(np.arcsin(np.clip(gain, 0.0, 1.0)))
+        self.angle_step = 0.0
+        self.finished = len(samples) == 0
+
+    def set_gain(self, gain, ramp_samples=0):
+        """
+        Sets the gain the voice should reach.
+
+        Parameters:
+            gain (float): The target gain in [0.0, 1.0].
+            ramp_samples (int): The number of samples a full 0 to 1 ramp takes. 0 applies the gain immediately.
+        """
+        self.target_angle = float(np.arcsin(np.clip(gain, 0.0, 1.0)))
+        if ramp_samples <= 0:
+            self.angle = self.target_angle
+            self.angle_step = 0.0
+        else:
+            self.angle_step = HALF_PI / ramp_samples
+
+    def mix_into(self, out):
+        """
+        Adds the next block of samples to the output buffer, wrapping around while repeats remain.
+
+        Parameters:
+            out (np.ndarray): The mono output buffer to mix into.
+        """
+        frames = len(out)
+        envelope = self._envelope(frames)
+        written = 0
+        while written < frames and not self.finished:
+            chunk = min(frames - written, len(self.samples) - self.position)
+            # Silent voices only advance their position to stay in sync
+            if np.ndim(envelope):
+                out[written : written + chunk] += (
+                    envelope[written : written + chunk]
+                    * self.samples[self.position : self.position + chunk]
+                )
+            elif envelope > 0.0:
+                out[written : written + chunk] += (
+                    envelope * self.samples[self.position : self.position + chunk]
+                )
+            self.position += chunk
+            written += chunk
+            if self.position == len(self.samples):
+                if self.loops == 0:
+                    self.finished = True
+                else:
+                    if self.loops > 0:
+                        self.loops -= 1
+                    self.position = 0
+
+    def _envelope(self, frames):
+        """
+        Computes the gain for the next block, advancing the ramp if one is in progress.
+
+        Parameters:
+            frames (int): The number of samples in the block.
+
+        Returns:
+            float or np.ndarray: A constant gain, or one gain per sample while ramping.
+        """
+        if self.angle == self.target_angle:
+            return np.sin(self.angle)
+
+        direction = 1.0 if self.target_angle > self.angle else -1.0
+        angles = self.angle + direction * self.angle_step * np.arange(1, frames + 1)
+        if direction > 0:
+            np.minimum(angles, self.target_angle, out=angles)
+        else:
+            np.maximum(angles, self.target_angle, out=angles)
+        self.angle = float(angles[-1])
+        return np.sin(angles).astype(np.float32)
+
+
+class StreamMixer:
+    """
+    Mixes the playing voices into a single mono sounddevice output stream.
+
+    Attributes:
+        sample_rate (int): The sample rate of the output stream.
+        voices (dict): The playing voices, keyed by sound name.
+        paused (bool): Whether output is paused. A paused mixer outputs silence and keeps every voice's position.
+
+    Methods:
+        play: Starts a sound from its beginning.
+        set_gain: Changes the gain of a playing sound.
+        crossfade: Fades one sound out while fading another in.
+        stop: Stops a single sound.
+        stop_all: Stops all sounds.
+        pause: Pauses the output.
+        unpause: Resumes the output.
+        close: Stops and closes the output stream.
+        _callback: Fills each output block from the playing voices.
+    """
+
+    def __init__(self, sample_rate):
+        """
+        Initializes the StreamMixer and starts its output stream.
+
+        Parameters:
+            sample_rate (int): The sample rate of the output stream.
+        """
+        self.sample_rate = sample_rate
+        self.voices = {}
+        self.paused = False
+        self._lock = threading.Lock()
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype=np.float32,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def play(self, name, samples, loops=0, gain=1.0):
+        """
+        Starts a sound from its beginning, replacing it if it is already playing.
+
+        Parameters:
+            name (str): The name identifying the sound.
+            samples (np.ndarray): The mono float32 samples of the sound.
+            loops (int): The number of extra repeats; -1 loops forever.
+            gain (float): The initial gain in [0.0, 1.0].
+        """
+        voice = Voice(samples, loops, gain)
+        with self._lock:
+            self.voices[name] = voice
+
+    def set_gain(self, name, gain, ramp_ms=0):
+        """
+        Changes the gain of a playing sound.
+
+        Parameters:
+            name (str): The name of the sound.
+            gain (float): The target gain in [0.0, 1.0].
+            ramp_ms (int): The duration of a full 0 to 1 ramp in milliseconds. 0 applies the gain immediately.
+        """
+        ramp_samples = int(self.sample_rate * ramp_ms / 1000)
+        with self._lock:
+            voice = self.voices.get(name)
+            if voice:
+                voice.set_gain(gain, ramp_samples)
+
+    def crossfade(self, old_name, new_name, duration_ms):
+        """
+        Fades one sound out while fading another in along an equal-power curve. The call returns at once; the ramp runs in the output stream.
+
+        Parameters:
+            old_name (str): The name of the sound to fade out.
+            new_name (str): The name of the sound to fade in.
+            duration_ms (int): The length of the cross-fade in milliseconds.
+        """
+        self.set_gain(old_name, 0.0, duration_ms)
+        self.set_gain(new_name, 1.0, duration_ms)
+
+    def stop(self, name):
+        """
+        Stops a single sound.
+
+        Parameters:
+            name (str): The name of the sound to stop.
+        """
+        with self._lock:
+            self.voices.pop(name, None)
+
+    def stop_all(self):
+        """
+        Stops all sounds.
+        """
+        with self._lock:
+            self.voices.clear()
+
+    def pause(self):
+        """
+        Pauses the output, keeping every voice's position.
+        """
+        self.paused = True
+
+    def unpause(self):
+        """
+        Resumes the output from where it was paused.
+        """
+        self.paused = False
+
+    def close(self):
+        """
+        Stops and closes the output stream, so PortAudio stops calling back into the mixer. Safe to call more than once.
+        """
+        if self._stream.closed:
+            return
+        self._stream.stop()
+        self._stream.close()
+
+    def _callback(self, outdata, frames, time_info, status):
+        """
+        Fills an output block with the sum of the playing voices and drops the voices that finished.
+
+        Parameters:
+            outdata (np.ndarray): The (frames, 1) output buffer to fill.
+            frames (int): The number of frames in the block.
+            time_info: Timing information from PortAudio (unused).
+            status: Under- and overflow flags from PortAudio (unused).
+        """
+        out = outdata[:, 0]
+        out.fill(0.0)
+        if self.paused:
+            return
+
+        with self._lock:
+            for voice in self.voices.values():
+                voice.mix_into(out)
+            finished = [name for name, voice in self.voices.items() if voice.finished]
+            for name in finished:
+                del self.voices[name]
@@ -10,12 +10,12 @@ Classes:
 
 import logging
 import threading
+from queue import Empty
 from pynput import keyboard
 
 from utils import CONFIG_PATH
 from CONFIG.config_manager import ConfigManager
 from audio.audio_manager import AudioManager
-from timbre_transfer.DDSP_engine import DDSPEngine
 from pose.pose_classifier import PoseClassifier
 
 # Constants for commands
@@ -80,9 +80,12 @@ class Controller:
         self.config_manager = ConfigManager(CONFIG_PATH)
         self.audio_manager = AudioManager(self.config_manager)
         self.pose_classifier = PoseClassifier(self.config_manager)
-        self.ddsp_engine = DDSPEngine()
+        self._ddsp_engine = None
         self.thread_manager = thread_manager
         self.command_queue = self.thread_manager.get_queue("gui_commands")
+        # Created up front, so a Clear clicked before the webcam thread starts
+        # can clear it
+        self.thread_manager.create_event("start_extraction")
         self.command_handler = CommandHandler(self)
         self.exit_listener = keyboard.Listener(on_press=self.on_press, daemon=True)
         self.is_first_recording = True
@@ -114,8 +117,20 @@ class Controller:
     def perform_timbre_transfer(self):
         """Perform a timbre transfer on the recorded audio."""
         logging.info("Morphing begins")
-        self.ddsp_engine.timbre_transfer()
-        self.audio_manager.load_sounds()
+        recorded_audio = self.audio_manager.get_recorded_audio()
+        morphed_audio = self.ddsp_engine.timbre_transfer(recorded_audio)
+        self.audio_manager.load_sounds(morphed_audio)
+
+    @property
+    def ddsp_engine(self):
+        """The timbre transfer engine, created on first use."""
+        if self._ddsp_engine is None:
+            # ddsp and librosa take seconds to import, so they are only
+            # loaded once the first recording is processed
+            from timbre_transfer.DDSP_engine import DDSPEngine
+
+            self._ddsp_engine = DDSPEngine()
+        return self._ddsp_engine
 
     def pose_classification(self):
         """Start the pose classification process."""
@@ -158,15 +173,31 @@ class Controller:
     def clear(self):
         """Clear the current audio, stopping playback and resetting the state."""
         self.audio_manager.clear()
-        self.stop_thread("pose_classification_thread")
-        self.stop_thread("audio_morphing")
+        # Stop feeding the extraction thread while no session is running
+        self.thread_manager.clear_event("start_extraction")
+        # The stop sentinel wakes the morphing thread blocked on its queue
+        if self.thread_manager.is_thread_active("audio_morphing"):
+            self.thread_manager.enqueue_message("morphing_data", -1)
+        try:
+            self.thread_manager.stop_threads(
+                ["pose_classification_thread", "audio_morphing"]
+            )
+        except Exception as e:
+            logging.error(f"Error while stopping threads: {e}")
+        # Drop the queue so no stale message leaks into the next session
+        self.thread_manager.delete_queue("morphing_data")
+        # The extraction thread keeps its reference to these queues, so they are
+        # drained rather than deleted
+        self.thread_manager.drain_queue("keypoints_frames")
+        self.thread_manager.drain_queue("keypoints_data")
 
     def _initialize_thread_events_and_queues(self):
         """Initialize thread-related events and queues."""
         self.thread_manager.set_event("start_extraction")
         self.thread_manager.create_event("start_pose_classification")
         self.thread_manager.set_event("start_pose_classification")
-        self.thread_manager.create_queue("morphing_data")
+        # The morphing thread only needs put/get, so skip Queue's extra locking
+        self.thread_manager.create_queue("morphing_data", simple=True)
 
     def run(self, stop_event):
         """
@@ -178,8 +209,13 @@ class Controller:
         logging.info("Press 'Esc' to close the connection at any time")
         self.exit_listener.start()
         while self.connection_is_active:
-            if not self.command_queue.empty():
-                command = self.command_queue.get()
+            # Block until a command arrives instead of spinning on empty()
+            try:
+                command = self.command_queue.get(timeout=0.1)
+            except Empty:
+                command = None
+
+            if command is not None:
                 self.command_handler.process_command(command)
 
             # Controlla se l'evento di stop è stato segnalato
@@ -197,6 +233,8 @@ class Controller:
         """
         if key == keyboard.Key.esc:
             self.connection_is_active = False
+            # Wake the main loop right away instead of at its next timeout
+            self.command_queue.put(None)
             return False
 
     def close_app(self):
@@ -211,6 +249,10 @@ class Controller:
                 if thread.ident != current_thread_id:
                     self.thread_manager.stop_thread(thread_name)
 
+            if self._ddsp_engine is not None:
+                self._ddsp_engine.close()
+            self.audio_manager.close()
+
             # Chiudi l'applicazione GUI
             self.app.quit()
 
@@ -1,68 +1,93 @@
 """
 gui_events.py
 
-This module defines the GuiEvents class for the application. It includes logic for handling synchronization between different GUI components through threading events. The GuiEvents class integrates with various components like buttons and triggers to orchestrate the core functionalities of user interaction within the application.
+This module defines the GuiEvents class for the application. It includes logic for handling synchronization between different GUI components through a shared event queue. The GuiEvents class integrates with various components like buttons and triggers to orchestrate the core functionalities of user interaction within the application.
 
 Classes:
-    GuiEvents: Manages threading events for GUI interaction.
+    QueuedEvent: A trigger that posts its name to a shared queue when set.
+    GuiEvents: Manages the event queue for GUI interaction.
 """
 
-import threading
+from queue import Empty, SimpleQueue
+
+
+class QueuedEvent:
+    """
+    A trigger that posts its name to a shared queue when set, so a consumer can block on one queue instead of scanning every event. The queue is the only state: each set is delivered once, and consuming it is what resets it.
+
+    Attributes:
+        name (str): The name posted to the queue when the event is set.
+
+    Methods:
+        set: Posts the event's name to the queue.
+    """
+
+    def __init__(self, name, event_queue):
+        """
+        Initializes the QueuedEvent with its name and the queue it posts to.
+
+        Parameters:
+            name (str): The name of the event.
+            event_queue (SimpleQueue): The queue shared by all events.
+        """
+        self.name = name
+        self._event_queue = event_queue
+
+    def set(self):
+        """
+        Posts the event's name to the shared queue.
+        """
+        self._event_queue.put(self.name)
 
 
 class GuiEvents:
     """
-    Manages threading events to synchronize user interactions in the GUI.
+    Manages the events that synchronize user interactions in the GUI through one shared queue.
 
     Attributes:
-        start_recording (threading.Event): Event to signal the start of a recording.
-        stop_recording (threading.Event): Event to signal the stop of a recording.
-        play (threading.Event): Event to signal that playback should start.
-        pause (threading.Event): Event to signal that playback should pause.
-        clear (threading.Event): Event to signal that the current data should be cleared.
-        events_map (dict): A mapping of event names to their threading.Event objects.
+        start_recording (QueuedEvent): Event to signal the start of a recording.
+        stop_recording (QueuedEvent): Event to signal the stop of a recording.
+        play (QueuedEvent): Event to signal that playback should start.
+        pause (QueuedEvent): Event to signal that playback should pause.
+        clear (QueuedEvent): Event to signal that the current data should be cleared.
 
     Methods:
-        get_triggered_event: Returns the name of the event that was triggered, if any.
-        reset_event: Resets the specified event to its default state (not set).
+        get_triggered_event: Waits for and returns the name of the next triggered event.
+        reset_event: Kept for compatibility; consuming an event already resets it.
     """
 
     def __init__(self):
         """
-        Initializes the GuiEvents with threading events for start, stop, play, pause, and clear actions.
+        Initializes the GuiEvents with events for start, stop, play, pause, and clear actions, all posting to one queue.
         """
-        self.start_recording = threading.Event()
-        self.stop_recording = threading.Event()
-        self.play = threading.Event()
-        self.pause = threading.Event()
-        self.clear = threading.Event()
-        self.events_map = {
-            "start_recording": self.start_recording,
-            "stop_recording": self.stop_recording,
-            "play": self.play,
-            "pause": self.pause,
-            "clear": self.clear,
-        }
-
-    def get_triggered_event(self):
+        self._event_queue = SimpleQueue()
+        self.start_recording = QueuedEvent("start_recording", self._event_queue)
+        self.stop_recording = QueuedEvent("stop_recording", self._event_queue)
+        self.play = QueuedEvent("play", self._event_queue)
+        self.pause = QueuedEvent("pause", self._event_queue)
+        self.clear = QueuedEvent("clear", self._event_queue)
+
+    def get_triggered_event(self, timeout=0):
         """
-        Checks all events and returns the name of the event that is set.
+        Returns the name of the next triggered event, waiting up to the given timeout. Each set is returned exactly once.
+
+        Parameters:
+            timeout (float or None): The number of seconds to wait. 0 returns immediately, None waits indefinitely.
 
         Returns:
             str: The name of the triggered event, or None if no event is set.
         """
-        for event_name, event_obj in self.events_map.items():
-            if event_obj.is_set():
-                return event_name
-        return None
+        try:
+            if timeout == 0:
+                return self._event_queue.get_nowait()
+            return self._event_queue.get(timeout=timeout)
+        except Empty:
+            return None
 
     def reset_event(self, event_name):
         """
-        Resets the specified event, allowing it to be triggered again.
+        Does nothing: get_triggered_event already consumes the event it returns. Kept so existing callers keep working.
 
         Parameters:
             event_name (str): The name of the event to reset.
         """
-        event_obj = self.events_map.get(event_name)
-        if event_obj:
-            event_obj.clear()
@@ -15,8 +15,24 @@ from gui.images_paths import (
     BACKGROUND_PATH,
     REC_BUTTON_PATH,
     REC_BUTTON_PRESSED_PATH,
+    REC_BUTTON_ON_PATH,
     PLAY_BUTTON_PATH,
     PLAY_BUTTON_PRESSED_PATH,
+    STOP_BUTTON_PATH,
+    STOP_BUTTON_PRESSED_PATH,
+    CLEAR_BUTTON_PATH,
+    CLEAR_BUTTON_PRESSED_PATH,
+)
+
+# Every image a button can show, decoded once when the GUI is built
+BUTTON_IMAGE_PATHS = (
+    REC_BUTTON_PATH,
+    REC_BUTTON_PRESSED_PATH,
+    REC_BUTTON_ON_PATH,
+    PLAY_BUTTON_PATH,
+    PLAY_BUTTON_PRESSED_PATH,
+    STOP_BUTTON_PATH,
+    STOP_BUTTON_PRESSED_PATH,
     CLEAR_BUTTON_PATH,
     CLEAR_BUTTON_PRESSED_PATH,
 )
@@ -32,13 +48,18 @@ class GuiComponents:
         play_btn: The playback button component.
         clear_btn: The clear button component.
         label: The label used to display the webcam feed.
+        _icons: The preloaded button icons, keyed by image path.
+        _button_icons: The (normal, pressed) icons currently assigned to each button.
 
     Methods:
+        set_button_images: Assigns the images a button shows in its normal and pressed states.
         _initialize_window_properties: Sets up the main window's icon, geometry, and title.
         _create_gui_components: Creates and initializes all the GUI components.
         _create_background_image: Sets the background image for the main window.
         _create_webcam_display_label: Creates the label to display the webcam feed.
         _create_button: Creates a button with normal and pressed images.
+        _show_pressed_image: Shows a button's pressed image while it is held down.
+        _show_normal_image: Restores a button's normal image when it is released.
     """
 
     def __init__(self, parent):
@@ -49,6 +70,8 @@ class GuiComponents:
             parent: The main window instance that will serve as the parent for all GUI components.
         """
         self.parent = parent
+        self._icons = {path: QtGui.QIcon(QPixmap(path)) for path in BUTTON_IMAGE_PATHS}
+        self._button_icons = {}
         self._initialize_window_properties()
         self._create_gui_components()
 
@@ -114,5 +137,49 @@ class GuiComponents:
         """
         button = QtWidgets.QPushButton(self.parent)
         button.setGeometry(x, y, width, height)
-        self.parent.set_button_style(button, normal_image, pressed_image)
+        # The style sheet is set once; the bottom padding pins the icon to the
+        # top-left corner, where the background image used to be drawn
+        icon_size = self._icons[normal_image].availableSizes()[0]
+        button.setIconSize(icon_size)
+        button.setStyleSheet(
+            f"QPushButton{{border: none; padding-bottom: {height - icon_size.height()}px;}}"
+        )
+        button.pressed.connect(lambda: self._show_pressed_image(button))
+        button.released.connect(lambda: self._show_normal_image(button))
+        self.set_button_images(button, normal_image, pressed_image)
         return button
+
+    def set_button_images(self, button, normal_image, pressed_image):
+        """
+        Assigns the images a button shows in its normal and pressed states, using the preloaded icons.
+
+        Parameters:
+            button: The QPushButton to update.
+            normal_image: The image path for the button's normal state.
+            pressed_image: The image path for the button's pressed state.
+        """
+        icons = (self._icons[normal_image], self._icons[pressed_image])
+        # A transition that keeps the button's images needs no Qt call
+        if self._button_icons.get(button) == icons:
+            return
+        self._button_icons[button] = icons
+        if not button.isDown():
+            button.setIcon(self._icons[normal_image])
+
+    def _show_pressed_image(self, button):
+        """
+        Shows the pressed image of a button while it is held down.
+
+        Parameters:
+            button: The QPushButton being pressed.
+        """
+        button.setIcon(self._button_icons[button][1])
+
+    def _show_normal_image(self, button):
+        """
+        Shows the normal image of a button once it is released.
+
+        Parameters:
+            button: The QPushButton being released.
+        """
+        button.setIcon(self._button_icons[button][0])
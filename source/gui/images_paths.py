@@ -1,50 +1,17 @@
 import os
 
-# Get the directory of the current file
-DIR_PATH = os.path.dirname(os.path.realpath(__file__))
+# Directory holding the UI images, resolved once relative to this file
+IMAGES_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "images"))
 
 # Paths to various UI assets.
-ICON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/music-notes.ico",
-)
-BACKGROUND_PATH = os.path.join(
-    DIR_PATH,
-    "../images/background.png",
-)
-REC_BUTTON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/recbutton.png",
-)
-REC_BUTTON_PRESSED_PATH = os.path.join(
-    DIR_PATH,
-    "../images/recbutton_pressed.png",
-)
-REC_BUTTON_ON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/recbutton_on.png",
-)
-PLAY_BUTTON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/playbutton.png",
-)
-PLAY_BUTTON_PRESSED_PATH = os.path.join(
-    DIR_PATH,
-    "../images/playbutton_pressed.png",
-)
-STOP_BUTTON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/stopbutton.png",
-)
-STOP_BUTTON_PRESSED_PATH = os.path.join(
-    DIR_PATH,
-    "../images/stopbutton_pressed.png",
-)
-CLEAR_BUTTON_PATH = os.path.join(
-    DIR_PATH,
-    "../images/clearbutton.png",
-)
-CLEAR_BUTTON_PRESSED_PATH = os.path.join(
-    DIR_PATH,
-    "../images/clearbutton_pressed.png",
-)
+ICON_PATH = os.path.join(IMAGES_DIR, "music-notes.ico")
+BACKGROUND_PATH = os.path.join(IMAGES_DIR, "background.png")
+REC_BUTTON_PATH = os.path.join(IMAGES_DIR, "recbutton.png")
+REC_BUTTON_PRESSED_PATH = os.path.join(IMAGES_DIR, "recbutton_pressed.png")
+REC_BUTTON_ON_PATH = os.path.join(IMAGES_DIR, "recbutton_on.png")
+PLAY_BUTTON_PATH = os.path.join(IMAGES_DIR, "playbutton.png")
+PLAY_BUTTON_PRESSED_PATH = os.path.join(IMAGES_DIR, "playbutton_pressed.png")
+STOP_BUTTON_PATH = os.path.join(IMAGES_DIR, "stopbutton.png")
+STOP_BUTTON_PRESSED_PATH = os.path.join(IMAGES_DIR, "stopbutton_pressed.png")
+CLEAR_BUTTON_PATH = os.path.join(IMAGES_DIR, "clearbutton.png")
+CLEAR_BUTTON_PRESSED_PATH = os.path.join(IMAGES_DIR, "clearbutton_pressed.png")
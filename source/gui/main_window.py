@@ -8,10 +8,11 @@ Classes:
 
 """
 
+from types import MappingProxyType
+
 from PyQt5.QtWidgets import QDialog
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import pyqtSignal
-from pynput.keyboard import Key, Controller
+from PyQt5.QtCore import Qt, pyqtSignal
 from gui.components import GuiComponents
 from gui.user_interactions import UserInteractions
 from gui.images_paths import (
@@ -26,6 +27,20 @@ from gui.images_paths import (
     CLEAR_BUTTON_PRESSED_PATH,
 )
 
+# Image paths of each button, built once; read-only since it is shared
+BUTTON_PATHS = MappingProxyType(
+    {
+        "rec": (REC_BUTTON_PATH, REC_BUTTON_ON_PATH, REC_BUTTON_PRESSED_PATH),
+        "play": (
+            PLAY_BUTTON_PATH,
+            STOP_BUTTON_PATH,
+            PLAY_BUTTON_PRESSED_PATH,
+            STOP_BUTTON_PRESSED_PATH,
+        ),
+        "clear": (CLEAR_BUTTON_PATH, CLEAR_BUTTON_PRESSED_PATH),
+    }
+)
+
 
 class Window(QDialog):
     """
@@ -35,14 +50,14 @@ class Window(QDialog):
         cmd_queue: A queue for GUI commands.
         gui: An instance of the GuiComponents class.
         interactions: An instance of the UserInteractions class for managing user interactions.
+        _last_image_key: The cacheKey of the last image shown, used to skip repeated frames.
 
     Methods:
         __init__: Constructs the main window and initializes components.
         _initialize_window_properties: Sets up the properties of the window.
         _initialize_user_interactions: Initializes the interactions with GUI components.
         set_image: Updates the image displayed on the main label.
-        set_button_style: Configures the visual style of a button using image paths.
-        close_event: Handles the event when the window is closed.
+        closeEvent: Emits the closing signal when the window is closed.
     """
 
     closing = pyqtSignal()
@@ -59,6 +74,9 @@ class Window(QDialog):
         # Extract queues from thread_manager
         self.cmd_queue = thread_manager.create_queue("gui_commands")
 
+        # Cache key of the last image shown on the label
+        self._last_image_key = None
+
         # Initialize window properties
         self._initialize_window_properties()
 
@@ -87,17 +105,7 @@ class Window(QDialog):
         Returns:
             UserInteractions: An initialized UserInteractions object for handling user interactions within the GUI.
         """
-        button_paths = {
-            "rec": (REC_BUTTON_PATH, REC_BUTTON_ON_PATH, REC_BUTTON_PRESSED_PATH),
-            "play": (
-                PLAY_BUTTON_PATH,
-                STOP_BUTTON_PATH,
-                PLAY_BUTTON_PRESSED_PATH,
-                STOP_BUTTON_PRESSED_PATH,
-            ),
-            "clear": (CLEAR_BUTTON_PATH, CLEAR_BUTTON_PRESSED_PATH),
-        }
-        return UserInteractions(self.gui, self.cmd_queue, button_paths)
+        return UserInteractions(self.gui, self.cmd_queue, BUTTON_PATHS)
 
     def set_image(self, image):
         """
@@ -106,33 +114,15 @@ class Window(QDialog):
         Parameters:
             image: An image object that will be converted to a QPixmap and displayed on the GUI.
         """
-        qt_image = QPixmap.fromImage(image)
+        # Skip the conversion and repaint if the same image is delivered again
+        key = image.cacheKey()
+        if key == self._last_image_key:
+            return
+        self._last_image_key = key
+        # Frames already arrive in the pixmap's native 32-bit layout
+        qt_image = QPixmap.fromImage(image, Qt.NoFormatConversion)
         self.gui.label.setPixmap(qt_image)
 
-    def set_button_style(self, button, normal_image, pressed_image):
-        """
-        Sets the visual style of a button using the provided image paths for its normal and pressed states.
-
-        Parameters:
-            button: The QPushButton object to be styled.
-            normal_image: The path to the image for the button's normal state.
-            pressed_image: The path to the image for the button's pressed state.
-        """
-        button.setStyleSheet(
-            f"QPushButton{{background-image: url({normal_image}); background-repeat: no-repeat; border: none;}}"
-            f"QPushButton::pressed{{background-image: url({pressed_image});}}"
-        )
-
-    def close_event(self, event):
-        """
-        Handles the window close event by simulating an ESC key press to ensure proper termination of the application.
-
-        Parameters:
-            event: The close event object that is passed when the QDialog is closed.
-        """
-        keyboard = Controller()
-        keyboard.press(Key.esc)
-
     def closeEvent(self, event):
         """
         Handles the window close event by emitting the 'closing' signal to ensure proper termination of the application.
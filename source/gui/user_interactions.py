@@ -4,9 +4,12 @@ user_interactions.py
 This module defines the UserInteractions for a GUI application. It includes logic for handling user actions such as starting/stopping recording, playing/pausing audio, and clearing sessions. The UserInteractions class integrates with GUI components and a command queue to orchestrate the core functionalities of user-triggered events.
 
 Classes:
+    GuiState: The recording and playback states of the GUI.
     UserInteractions: Manages interactions between the user and the GUI components.
 """
 
+from enum import IntEnum
+
 from gui.images_paths import (
     REC_BUTTON_PATH,
     REC_BUTTON_ON_PATH,
@@ -17,6 +20,62 @@ from gui.images_paths import (
     STOP_BUTTON_PRESSED_PATH,
 )
 
+# Button events
+REC = "rec"
+PLAY = "play"
+CLEAR = "clear"
+
+
+class GuiState(IntEnum):
+    """
+    The recording and playback states of the GUI. Recording and pausing are independent, so each combination is its own state.
+    """
+
+    IDLE = 0
+    RECORDING = 1
+    PAUSED = 2
+    RECORDING_PAUSED = 3
+
+
+# Button images shown after a transition
+_REC_ON_IMAGES = (REC, REC_BUTTON_ON_PATH, REC_BUTTON_PRESSED_PATH)
+_REC_OFF_IMAGES = (REC, REC_BUTTON_PATH, REC_BUTTON_PRESSED_PATH)
+_PLAYING_IMAGES = (PLAY, STOP_BUTTON_PATH, STOP_BUTTON_PRESSED_PATH)
+_PAUSED_IMAGES = (PLAY, PLAY_BUTTON_PATH, PLAY_BUTTON_PRESSED_PATH)
+
+# (state, event) -> (next state, command, button images to apply)
+TRANSITIONS = {
+    (GuiState.IDLE, REC): (GuiState.RECORDING, "Start Rec", (_REC_ON_IMAGES,)),
+    (GuiState.PAUSED, REC): (
+        GuiState.RECORDING_PAUSED,
+        "Start Rec",
+        (_REC_ON_IMAGES,),
+    ),
+    (GuiState.RECORDING, REC): (
+        GuiState.IDLE,
+        "Stop Rec",
+        (_REC_OFF_IMAGES, _PLAYING_IMAGES),
+    ),
+    (GuiState.RECORDING_PAUSED, REC): (
+        GuiState.IDLE,
+        "Stop Rec",
+        (_REC_OFF_IMAGES, _PLAYING_IMAGES),
+    ),
+    (GuiState.IDLE, PLAY): (GuiState.PAUSED, "Pause", (_PAUSED_IMAGES,)),
+    (GuiState.RECORDING, PLAY): (
+        GuiState.RECORDING_PAUSED,
+        "Pause",
+        (_PAUSED_IMAGES,),
+    ),
+    (GuiState.PAUSED, PLAY): (GuiState.IDLE, "Play", (_PLAYING_IMAGES,)),
+    (GuiState.RECORDING_PAUSED, PLAY): (
+        GuiState.RECORDING,
+        "Play",
+        (_PLAYING_IMAGES,),
+    ),
+}
+TRANSITIONS.update({(state, CLEAR): (state, "Clear", ()) for state in GuiState})
+
 
 class UserInteractions:
     """
@@ -27,15 +86,16 @@ class UserInteractions:
     Attributes:
         gui (object): The GUI components that this class will interact with.
         cmd_queue (queue.Queue): The command queue for communicating with other parts of the application.
-        paused (bool): A flag to indicate if the playback is paused.
-        isRecording (bool): A flag to indicate if recording is currently active.
+        state (GuiState): The current recording and playback state.
         button_paths (dict): A dictionary mapping buttons to their image paths.
+        _buttons (dict): Maps each button event to its QPushButton.
 
     Methods:
         init_connections: Connects the GUI buttons to their respective event handlers.
         handle_recording: Handles the logic for the recording button.
         handle_play_pause: Handles the logic for toggling play/pause.
         handle_clear: Sends a command to clear the current session or recording.
+        _dispatch: Applies the transition for a button event.
     """
 
     def __init__(self, gui_components, cmd_queue, button_paths):
@@ -49,9 +109,13 @@ class UserInteractions:
         """
         self.gui = gui_components
         self.cmd_queue = cmd_queue
-        self.paused = False
-        self.isRecording = False
+        self.state = GuiState.IDLE
         self.button_paths = button_paths
+        self._buttons = {
+            REC: self.gui.rec_btn,
+            PLAY: self.gui.play_btn,
+            CLEAR: self.gui.clear_btn,
+        }
         self.init_connections()
 
     def init_connections(self):
@@ -65,43 +129,31 @@ class UserInteractions:
         Toggles the recording state and updates the recording button's appearance.
         Posts the appropriate command to the command queue based on the recording state.
         """
-        if self.isRecording:
-            self.gui.parent.set_button_style(
-                self.gui.rec_btn, REC_BUTTON_PATH, REC_BUTTON_PRESSED_PATH
-            )
-            self.gui.parent.set_button_style(
-                self.gui.play_btn, STOP_BUTTON_PATH, STOP_BUTTON_PRESSED_PATH
-            )
-            self.paused = False
-            self.isRecording = False
-            self.cmd_queue.put("Stop Rec")
-        else:
-            self.gui.parent.set_button_style(
-                self.gui.rec_btn, REC_BUTTON_ON_PATH, REC_BUTTON_PRESSED_PATH
-            )
-            self.isRecording = True
-            self.cmd_queue.put("Start Rec")
+        self._dispatch(REC)
 
     def handle_play_pause(self):
         """
         Toggles the playback state and updates the play/pause button's appearance.
         Posts the appropriate command to the command queue based on the playback state.
         """
-        if self.paused:
-            self.gui.parent.set_button_style(
-                self.gui.play_btn, STOP_BUTTON_PATH, STOP_BUTTON_PRESSED_PATH
-            )
-            self.paused = False
-            self.cmd_queue.put("Play")
-        else:
-            self.gui.parent.set_button_style(
-                self.gui.play_btn, PLAY_BUTTON_PATH, PLAY_BUTTON_PRESSED_PATH
-            )
-            self.paused = True
-            self.cmd_queue.put("Pause")
+        self._dispatch(PLAY)
 
     def handle_clear(self):
         """
         Handles the clear button behavior by posting a 'Clear' command to the command queue.
         """
-        self.cmd_queue.put("Clear")
+        self._dispatch(CLEAR)
+
+    def _dispatch(self, event):
+        """
+        Looks up the transition for a button event in the current state, updates the button images, and posts the command.
+
+        Parameters:
+            event (str): The button event, one of REC, PLAY or CLEAR.
+        """
+        self.state, command, images = TRANSITIONS[(self.state, event)]
+        for button, normal_image, pressed_image in images:
+            self.gui.set_button_images(
+                self._buttons[button], normal_image, pressed_image
+            )
+        self.cmd_queue.put(command)
@@ -12,14 +12,15 @@ import sys
 import logging
 import os
 
+import cv2
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
-import tensorflow as tf
-from tensorflow.python.ops.numpy_ops import np_config
 
 from gui.main_window import Window
 from webcam.webcam import Webcam
 from controller import Controller
 from thread_manager import ThreadManager
+from utils import CONFIG_PATH, load_config
 
 # Configure logging at INFO level
 logging.basicConfig(level=logging.INFO)
@@ -35,12 +36,33 @@ class TensorFlowConfiguration:
     @staticmethod
     def configure():
         """
-        Set TensorFlow's verbosity to ERROR level and enable numpy-like behavior.
+        Set TensorFlow's verbosity to ERROR level, enable numpy-like behavior, and size the native thread pools.
+
+        TensorFlow is imported here rather than at module level, so the window can be shown before it loads.
         """
+        parallelism = load_config(CONFIG_PATH)["parallelism"]
+        # numpy and cv2 are already loaded, so only TensorFlow's OpenMP runtime
+        # still reads this; a value set in the environment takes precedence
+        os.environ.setdefault("OMP_NUM_THREADS", str(parallelism["omp_threads"]))
+
+        import tensorflow as tf
+        from tensorflow.python.ops.numpy_ops import np_config
+
         tf.compat.v1.logging.set_verbosity(tf.compat.v1.logging.ERROR)
         os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
         np_config.enable_numpy_behavior()
 
+        # The webcam, MediaPipe and audio threads keep some cores busy, so
+        # TensorFlow's pools are kept off them instead of claiming them all
+        tf.config.threading.set_intra_op_parallelism_threads(
+            max(1, (os.cpu_count() or 1) - parallelism["reserved_cores"])
+        )
+        tf.config.threading.set_inter_op_parallelism_threads(
+            parallelism["inter_op_threads"]
+        )
+        # Frames are small, so OpenCV's own pool costs more than it saves
+        cv2.setNumThreads(parallelism["opencv_threads"])
+
 
 class Application:
     """
@@ -54,10 +76,13 @@ class Application:
         Initializes the application, the thread manager, TensorFlow configurations, and the main GUI components.
         """
         self.thread_manager = ThreadManager()
-        TensorFlowConfiguration.configure()
-        self.app = QApplication(sys.argv)
+        # Reuse an existing instance, e.g. when the Application is built twice
+        self.app = QApplication.instance() or QApplication(sys.argv)
         self.main_window = Window(self.thread_manager)
-        self.webcam = Webcam(self.thread_manager, self.main_window.set_image)
+        # Paint the window before the seconds-long TensorFlow import
+        self.app.processEvents()
+        TensorFlowConfiguration.configure()
+        self.webcam = Webcam(self.thread_manager)
         self.controller = Controller(self.app, self.thread_manager)
         self.main_window.closing.connect(self.controller.close_app)
 
@@ -74,8 +99,16 @@ class Application:
         Initiates the webcam thread, enabling the capture of frames, and connects the GUI update signal.
         """
         try:
+            # Connect before starting, so no early frame is lost. Both slots are
+            # queued to the GUI thread in connection order, so the webcam's
+            # acknowledgement runs after set_image has painted each frame
+            self.webcam.newFrameSignal.connect(
+                self.main_window.set_image, Qt.QueuedConnection
+            )
+            self.webcam.newFrameSignal.connect(
+                self.webcam.frame_displayed, Qt.QueuedConnection
+            )
             self.thread_manager.start_thread("webcam", self.webcam.run)
-            self.webcam.newFrameSignal.connect(self.main_window.set_image)
         except Exception as e:
             logging.error(f"Error starting webcam thread: {e}")
 
@@ -9,23 +9,37 @@ Classes:
 
 """
 
+import logging
 import numpy as np
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense
 from utils import CONFIG_PATH, load_config
 from queue import Empty
 
+# Model files with this suffix are run through the TFLite interpreter
+TFLITE_SUFFIX = ".tflite"
+
+# How long the classifier waits for a sequence before checking its stop event
+SEQUENCE_WAIT_SECONDS = 0.1
+
+# Largest change of any keypoint value, in normalized image coordinates, for
+# a sequence to count as unchanged since the last one classified
+UNCHANGED_SEQUENCE_TOLERANCE = 0.01
+
 
 class PoseModel:
     """
     This class is responsible for initializing and utilizing a neural network model for classifying poses based on sequences of keypoints.
 
     Attributes:
-        actions (list): List of possible actions that the model can classify.
-        model (Sequential): The TensorFlow/Keras sequential model for pose classification.
+        actions (tuple): The possible actions that the model can classify, in output order.
+        model (Sequential): The TensorFlow/Keras sequential model for pose classification, or None when a TFLite model is used.
+        input_dim (int): The number of keypoint values per frame the model expects.
+        _infer: The forward pass for a single input sequence, either a traced graph or a TFLite interpreter call.
 
     Methods:
         _init_model: Initializes and compiles the LSTM neural network.
+        _init_inference: Traces the model's forward pass into a graph for one sequence.
+        _init_tflite_inference: Loads a TFLite model, such as a quantized one, for one sequence.
+        _warm_up: Runs the forward pass once on a blank sequence.
         predict: Makes a prediction on a single sequence of keypoints.
         predict_action: Predicts the human action from a sequence of keypoints with a confidence threshold.
     """
@@ -35,13 +49,20 @@ class PoseModel:
         Initializes the PoseModel with a specified path to the model weights, sequence length for the input data, and possible actions.
 
         Parameters:
-            model_path (str): The path to the pre-trained model weights.
+            model_path (str): The path to the pre-trained model weights, or to a .tflite model made by pose/quantize_model.py.
             sequence_length (int): The length of the input sequence the model expects.
             actions (list): A list of actions that the model is trained to recognize.
             model_config (dict, optional): Configuration for the LSTM and Dense layers of the model.
         """
-        self.actions = actions
-        self.model = self._init_model(model_path, sequence_length, model_config)
+        # Only ever indexed by the predicted class, which a tuple does directly
+        self.actions = tuple(actions)
+        if model_path.endswith(TFLITE_SUFFIX):
+            self.model = None
+            self._infer = self._init_tflite_inference(model_path)
+        else:
+            self.model = self._init_model(model_path, sequence_length, model_config)
+            self._infer = self._init_inference(sequence_length)
+        self._warm_up(sequence_length)
 
     def _init_model(self, model_path, sequence_length, config=None):
         """
@@ -55,6 +76,11 @@ class PoseModel:
         Returns:
             Sequential: The compiled TensorFlow/Keras model.
         """
+        # TensorFlow is imported here, once the GUI is up, rather than when
+        # the module is imported during startup
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Input
+
         if config is None:
             config = {
                 "lstm_layers": [64, 128, 64],
@@ -63,22 +89,13 @@ class PoseModel:
                 "num_classes": len(self.actions),
             }
 
-        model = Sequential()
+        # The input shape is declared once, up front, so every LSTM is built alike
+        model = Sequential([Input(shape=(sequence_length, config["input_dim"]))])
 
-        # Add LSTM layers
+        # Add LSTM layers; all but the last pass the whole sequence on
+        last_lstm = len(config["lstm_layers"]) - 1
         for i, units in enumerate(config["lstm_layers"]):
-            return_seq = i != len(config["lstm_layers"]) - 1
-            if i == 0:
-                model.add(
-                    LSTM(
-                        units,
-                        return_sequences=return_seq,
-                        activation="relu",
-                        input_shape=(sequence_length, config["input_dim"]),
-                    )
-                )
-            else:
-                model.add(LSTM(units, return_sequences=return_seq, activation="relu"))
+            model.add(LSTM(units, return_sequences=i != last_lstm, activation="relu"))
 
         # Add Dense layers
         for units in config["dense_layers"]:
@@ -89,6 +106,67 @@ class PoseModel:
 
         return model
 
+    def _init_inference(self, sequence_length):
+        """
+        Traces the model's forward pass into a graph for a single sequence.
+
+        Keras' predict sets up a data pipeline and callbacks on every call, which costs far more than the LSTM itself for one (1, sequence_length, input_dim) input. The fixed input signature means the graph is traced exactly once, and XLA compiles it for that one shape, fusing each LSTM step's gate operations into fewer kernels. The compilation happens during the warm-up.
+
+        Parameters:
+            sequence_length (int): The length of the input sequence.
+
+        Returns:
+            ConcreteFunction: The traced forward pass.
+        """
+        import tensorflow as tf
+
+        self.input_dim = self.model.input_shape[-1]
+        infer = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[
+                tf.TensorSpec((1, sequence_length, self.input_dim), tf.float32)
+            ],
+            jit_compile=True,
+        )
+        return infer.get_concrete_function()
+
+    def _init_tflite_inference(self, model_path):
+        """
+        Loads a TFLite model and returns a function running it on one sequence.
+
+        The interpreter's tensors are allocated once here, and every call reuses them.
+
+        Parameters:
+            model_path (str): The path to the .tflite model.
+
+        Returns:
+            function: Maps a (1, sequence_length, input_dim) float32 array to the action probabilities.
+        """
+        import tensorflow as tf
+
+        interpreter = tf.lite.Interpreter(model_path=model_path)
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        input_index = input_details["index"]
+        self.input_dim = int(input_details["shape"][-1])
+        output_index = interpreter.get_output_details()[0]["index"]
+
+        def infer(batch):
+            interpreter.set_tensor(input_index, batch)
+            interpreter.invoke()
+            return interpreter.get_tensor(output_index)
+
+        return infer
+
+    def _warm_up(self, sequence_length):
+        """
+        Runs the forward pass once on a blank sequence, so kernel setup and memory allocation happen at startup rather than on the user's first gesture.
+
+        Parameters:
+            sequence_length (int): The length of the input sequence.
+        """
+        self.predict(np.zeros((sequence_length, self.input_dim), dtype=np.float32))
+
     def predict(self, sequence):
         """
         Predicts the probabilities of each action for a single sequence of keypoints.
@@ -99,7 +177,8 @@ class PoseModel:
         Returns:
             np.array: Probabilities of each action for the input sequence.
         """
-        return self.model.predict(np.expand_dims(sequence, axis=0))[0]
+        batch = np.expand_dims(sequence, axis=0).astype(np.float32, copy=False)
+        return np.asarray(self._infer(batch))[0]
 
     def predict_action(self, sequence, threshold=0.6):
         """
@@ -131,11 +210,14 @@ class PoseClassifier:
         model_path (str): The path to the neural network model file.
         config (dict): Configuration settings for the classifier.
         pose_model (PoseModel): The PoseModel object used for predicting actions.
+        _last_sequence (np.array): The last sequence run through the model, or None.
+        _last_action (str): The last action sent to the morphing system, or None.
 
     Methods:
         classify_pose: Processes keypoints to classify poses and sends predictions to the morphing system.
         _prepare_sequence: Prepares the input sequence for classification.
         _handle_prediction: Handles the prediction results and updates the morphing system.
+        _is_unchanged: Checks whether a sequence matches the last one classified.
     """
 
     def __init__(self, config_manager):
@@ -151,8 +233,10 @@ class PoseClassifier:
         self.pose_model = PoseModel(
             self.model_path,
             self.config["pose_classification"]["sequence_length"],
-            np.array(self.config["pose_classification"]["actions"]),
+            self.config["pose_classification"]["actions"],
         )
+        self._last_sequence = None
+        self._last_action = None
 
     def classify_pose(self, thread_manager, stop_event):
         """
@@ -162,27 +246,28 @@ class PoseClassifier:
             thread_manager: The manager handling different threads in the application.
             stop_event: An event to signal when to stop the classification process.
         """
-        predictions = []
         threshold = 0.6
+        # Every session starts afresh, so its first action is always sent
+        self._last_sequence = None
+        self._last_action = None
 
         keypoints_queue = thread_manager.get_queue("keypoints_data")
         morphing_queue = thread_manager.get_queue("morphing_data")
+        classification_event = thread_manager.create_event("start_pose_classification")
 
         while not stop_event.is_set():
             try:
-                sequence = keypoints_queue.get(timeout=1)
+                sequence = keypoints_queue.get(timeout=SEQUENCE_WAIT_SECONDS)
             except Empty:
                 continue
 
-            if sequence == -1:
+            if np.isscalar(sequence) and sequence == -1:
                 break
 
-            if thread_manager.is_event_set("start_pose_classification"):
+            if classification_event.is_set():
                 sequence = self._prepare_sequence(sequence)
                 if sequence is not None:
-                    predicted_index = self._handle_prediction(
-                        sequence, predictions, threshold
-                    )
+                    predicted_index = self._handle_prediction(sequence, threshold)
                     if predicted_index is not None:
                         morphing_queue.put(predicted_index)
 
@@ -190,44 +275,63 @@ class PoseClassifier:
         """
         Prepares and validates the input sequence for classification.
 
+        The producer already sends a contiguous (frames, keypoints) float32 array, so a full sequence is used as is, without a copy.
+
         Parameters:
-            sequence (list): The raw sequence of keypoints.
+            sequence (np.array): The sequence of keypoints, one row per frame.
 
         Returns:
             np.array: The prepared sequence ready for prediction or None if the sequence is not valid.
         """
-        sequence = np.asarray(sequence)
-
-        if sequence.shape[1] != 30:
-            if sequence.shape[1] > 30:
+        # Frames are along the first axis
+        if sequence.shape[0] != 30:
+            if sequence.shape[0] > 30:
                 return sequence[:30, :]
             else:
                 return None
         return sequence
 
-    def _handle_prediction(self, sequence, predictions, threshold):
+    def _handle_prediction(self, sequence, threshold):
         """
-        Processes the prediction made by the PoseModel and manages the list of previous predictions.
+        Processes the prediction made by the PoseModel, sending an action only when it differs from the last one sent.
+
+        A sequence matching the last one classified would get the same prediction, which is never sent twice, so the model is not run for it. This skips inference while the user holds still or is out of frame.
 
         Parameters:
             sequence (np.array): The sequence of keypoints to predict the action for.
-            predictions (list): The list of previous predictions.
             threshold (float): The threshold for a confident prediction.
 
         Returns:
             int: The index of the predicted action to be sent to the morphing system or None if the prediction is not confident.
         """
+        if self._is_unchanged(sequence):
+            return None
+        self._last_sequence = sequence
+
         predicted_action, predicted_index = self.pose_model.predict_action(
             sequence, threshold
         )
 
         if predicted_index is not None:
-            print(f"Current M0RPH: {predicted_action}")
-            if len(predictions) > 0:
-                if predicted_action != predictions[-1]:
-                    predictions.append(predicted_action)
-                    return predicted_index
-            else:
-                predictions.append(predicted_action)
+            logging.info("Current M0RPH: %s", predicted_action)
+            if predicted_action != self._last_action:
+                self._last_action = predicted_action
                 return predicted_index
         return None
+
+    def _is_unchanged(self, sequence):
+        """
+        Checks whether every keypoint value of a sequence is within UNCHANGED_SEQUENCE_TOLERANCE of the last sequence classified.
+
+        Parameters:
+            sequence (np.array): The sequence of keypoints about to be classified.
+
+        Returns:
+            bool: True if the sequence matches the last one classified.
+        """
+        last = self._last_sequence
+        return (
+            last is not None
+            and last.shape == sequence.shape
+            and np.allclose(sequence, last, rtol=0, atol=UNCHANGED_SEQUENCE_TOLERANCE)
+        )
@@ -5,14 +5,32 @@ This module defines the KeypointsExtractor and KeypointsProcessor classes for th
 
 Classes:
     KeypointsExtractor: Extracts pose, left hand, and right hand keypoints from images.
+    KeypointsSequence: Holds the most recent frames' keypoints in a preallocated ring buffer.
     KeypointsProcessor: Processes frames to extract and manage sequences of keypoints for further analysis or action.
 
 """
 
+import logging
+from itertools import chain
+from operator import attrgetter
+from queue import Empty, Full
+
 import cv2
 import mediapipe as mp
 import numpy as np
 
+# Frames are shrunk so their longest side is this many pixels before detection
+DETECTION_SIZE = 256
+
+# Number of keypoint values per frame: 33 pose landmarks with 4 values, and
+# 21 landmarks with 3 values for each hand
+POSE_SIZE = 33 * 4
+HAND_SIZE = 21 * 3
+KEYPOINTS_SIZE = POSE_SIZE + 2 * HAND_SIZE
+
+# How long the extraction thread waits for a frame before checking its stop event
+FRAME_WAIT_SECONDS = 0.1
+
 
 class KeypointsExtractor:
     """
@@ -25,27 +43,58 @@ class KeypointsExtractor:
     Methods:
         detect_keypoints: Detects and returns the keypoints from a given image.
         extract_keypoints: Extracts and concatenates pose and hand keypoints from the detection results.
-        _extract_landmarks: Helper method to flatten the detected landmarks.
+        close: Releases the Holistic model's graph and its buffers.
+        _downsample: Shrinks an image to the detection size before inference.
+        _extract_landmarks: Helper method to write the flattened detected landmarks into the keypoints array.
     """
 
-    def __init__(self, min_detection_confidence=0.5, min_tracking_confidence=0.5):
+    # Landmark fields read for each keypoint type, fetched in one C-level call
+    _LANDMARK_GETTERS = {
+        "pose": attrgetter("x", "y", "z", "visibility"),
+        "hand": attrgetter("x", "y", "z"),
+    }
+
+    def __init__(
+        self,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+        model_complexity=1,
+    ):
         """
         Initializes the KeypointsExtractor with mediapipe's Holistic model with specified confidence levels.
 
         Parameters:
             min_detection_confidence: The minimum confidence value ([0.0, 1.0]) for the detection to be considered successful.
             min_tracking_confidence: The minimum confidence value ([0.0, 1.0]) for the tracking to be considered successful.
+            model_complexity: The pose landmark model to run: 0 (lite, fastest), 1 (full) or 2 (heavy).
         """
         self._model = mp.solutions.holistic.Holistic(
+            static_image_mode=False,
+            model_complexity=model_complexity,
+            smooth_landmarks=True,
+            refine_face_landmarks=False,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
         )
         self.LANDMARK_SIZES = {"pose": (33, 4), "hand": (21, 3)}
+        # Offsets of the pose, left hand and right hand in the keypoints array
+        pose_size = POSE_SIZE
+        hand_size = HAND_SIZE
+        self._slices = (
+            slice(0, pose_size),
+            slice(pose_size, pose_size + hand_size),
+            slice(pose_size + hand_size, KEYPOINTS_SIZE),
+        )
+        self._rgb_buffer = None
+        self._small_buffer = None
+        self._detection_shape = None
 
     def detect_keypoints(self, image):
         """
         Detects keypoints in the given BGR image using the initialized Holistic model.
 
+        The image is first shrunk to DETECTION_SIZE, keeping its aspect ratio. The landmarks come back normalized to [0, 1], so they are the same as on the full-size image.
+
         Parameters:
             image: The image in which keypoints are to be detected.
 
@@ -53,53 +102,156 @@ class KeypointsExtractor:
             A processed image with detected landmarks by the Holistic model.
         """
         try:
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            image_rgb.flags.writeable = False
-            return self._model.process(image_rgb)
+            small = self._downsample(image)
+            # Convert into the same buffer every frame instead of allocating one
+            if self._rgb_buffer is not None:
+                self._rgb_buffer.flags.writeable = True
+            self._rgb_buffer = cv2.cvtColor(
+                small, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer
+            )
+            self._rgb_buffer.flags.writeable = False
+            return self._model.process(self._rgb_buffer)
         except Exception as e:
             raise Exception(f"Error detecting keypoints: {e}")
 
-    def _extract_landmarks(self, landmarks, landmark_type):
+    def close(self):
+        """
+        Releases the Holistic model's calculator graph and the packets it holds.
+        """
+        self._model.close()
+
+    def _downsample(self, image):
         """
-        Extracts and flattens the landmarks from the provided mediapipe landmark results based on the specified type.
+        Shrinks the image so its longest side is DETECTION_SIZE, reusing the output buffer across frames.
 
         Parameters:
-            landmarks: The landmark results from mediapipe's Holistic model.
-            landmark_type: A string indicating the type of landmarks to extract ('pose' or 'hand').
+            image: The BGR image to shrink.
 
         Returns:
-            A flattened numpy array of the landmarks.
+            The shrunk image, or the image itself if it is already small enough.
+        """
+        h, w = image.shape[:2]
+        if self._detection_shape is None or self._detection_shape[0] != (w, h):
+            scale = DETECTION_SIZE / max(w, h)
+            size = (round(w * scale), round(h * scale)) if scale < 1 else None
+            self._detection_shape = ((w, h), size)
+
+        size = self._detection_shape[1]
+        if size is None:
+            return image
+        self._small_buffer = cv2.resize(
+            image, size, dst=self._small_buffer, interpolation=cv2.INTER_AREA
+        )
+        return self._small_buffer
+
+    def _extract_landmarks(self, landmarks, landmark_type, out):
+        """
+        Writes the flattened landmarks of the specified type into the given slice of the keypoints array.
+
+        Parameters:
+            landmarks: The landmark results from mediapipe's Holistic model.
+            landmark_type: A string indicating the type of landmarks to extract ('pose' or 'hand').
+            out: The zero-initialized float32 slice that receives the flattened landmarks.
         """
-        num_landmarks, dimensions = self.LANDMARK_SIZES[landmark_type]
         if landmarks:
-            if landmark_type == "pose":
-                return np.array(
-                    [
-                        [res.x, res.y, res.z, res.visibility]
-                        for res in landmarks.landmark
-                    ]
-                ).flatten()
-            else:
-                return np.array(
-                    [[res.x, res.y, res.z][:dimensions] for res in landmarks.landmark]
-                ).flatten()
-        return np.zeros(num_landmarks * dimensions)
-
-    def extract_keypoints(self, results):
+            get_values = self._LANDMARK_GETTERS[landmark_type]
+            out[:] = np.fromiter(
+                chain.from_iterable(map(get_values, landmarks.landmark)),
+                dtype=np.float32,
+                count=len(out),
+            )
+
+    def extract_keypoints(self, results, out=None):
         """
         Extracts and concatenates the keypoints for pose, left hand, and right hand from the detection results.
 
+        The keypoints are written straight into one float32 array, left at zero for any part that was not detected.
+
         Parameters:
             results: The detection results containing the pose, left hand, and right hand landmarks.
+            out: An optional float32 array of KEYPOINTS_SIZE values to write into, instead of allocating a new one.
 
         Returns:
             A numpy array containing the flattened keypoints for pose, left hand, and right hand.
         """
-        pose = self._extract_landmarks(results.pose_landmarks, "pose")
-        left_hand = self._extract_landmarks(results.left_hand_landmarks, "hand")
-        right_hand = self._extract_landmarks(results.right_hand_landmarks, "hand")
+        if out is None:
+            keypoints = np.zeros(KEYPOINTS_SIZE, dtype=np.float32)
+        else:
+            keypoints = out
+            keypoints.fill(0.0)
+        pose, left_hand, right_hand = self._slices
+        self._extract_landmarks(results.pose_landmarks, "pose", keypoints[pose])
+        self._extract_landmarks(
+            results.left_hand_landmarks, "hand", keypoints[left_hand]
+        )
+        self._extract_landmarks(
+            results.right_hand_landmarks, "hand", keypoints[right_hand]
+        )
+        return keypoints
+
+
+class KeypointsSequence:
+    """
+    Holds the keypoints of the most recent frames in a preallocated ring buffer.
+
+    Each frame's keypoints are written straight into the next row, so keeping the sequence costs no allocation per frame.
+
+    Attributes:
+        length: The number of frames kept.
+        _buffer: The (length, KEYPOINTS_SIZE) float32 ring of keypoints.
+        _head: The row the next frame is written to, which is also the oldest row once the ring is full.
+        _count: The number of frames written, capped at length.
 
-        return np.concatenate([pose, left_hand, right_hand])
+    Methods:
+        next_slot: Returns the row for the next frame, dropping the oldest one if the ring is full.
+        is_full: Tells whether the ring holds length frames.
+        snapshot: Returns a copy of the frames in chronological order.
+    """
+
+    def __init__(self, length):
+        """
+        Initializes an empty KeypointsSequence.
+
+        Parameters:
+            length: The number of frames to keep.
+        """
+        self.length = length
+        self._buffer = np.zeros((length, KEYPOINTS_SIZE), dtype=np.float32)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def next_slot(self):
+        """
+        Returns the row the next frame's keypoints are written to, overwriting the oldest frame once the ring is full.
+
+        Returns:
+            A writable view of one row of the ring.
+        """
+        slot = self._buffer[self._head]
+        self._head = (self._head + 1) % self.length
+        self._count = min(self._count + 1, self.length)
+        return slot
+
+    def is_full(self):
+        """
+        Tells whether the ring holds a full sequence.
+
+        Returns:
+            True if length frames have been written.
+        """
+        return self._count == self.length
+
+    def snapshot(self):
+        """
+        Copies the full ring in chronological order, oldest frame first.
+
+        Returns:
+            A new (length, KEYPOINTS_SIZE) array, safe to hand to another thread.
+        """
+        return np.concatenate((self._buffer[self._head :], self._buffer[: self._head]))
 
 
 class KeypointsProcessor:
@@ -109,76 +261,105 @@ class KeypointsProcessor:
     Attributes:
         keypoints_extractor: An instance of KeypointsExtractor to extract keypoints from frames.
         queue: A queue to store sequences of keypoints for further processing.
-        boost: An integer representing the factor by which the counter is incremented.
+        boost: An integer factor that stretches the interval between sequences sent to the queue.
         SEQUENCE_LENGTH: The fixed length of the keypoints sequence to be maintained.
 
     Methods:
+        new_sequence: Creates an empty keypoints sequence of the fixed length.
         update_frame_data: Updates the keypoints sequence with keypoints extracted from a new frame.
+        extract_from_queue: Runs keypoints extraction on the frames of a queue, in its own thread.
         _extract_keypoints_from_frame: Extracts keypoints from the provided frame.
-        _update_sequence_and_counter: Manages the keypoints sequence and counter.
+        _push_sequence_on_schedule: Sends the keypoints sequence to the queue every push interval.
     """
 
     SEQUENCE_LENGTH = 30
 
-    def __init__(self, queue, boost):
+    def __init__(self, queue, boost, model_complexity=1):
         """
-        Initializes KeypointsProcessor with a queue for storing sequences and a boost factor for the counter.
+        Initializes KeypointsProcessor with a queue for storing sequences and a boost factor for the push interval.
 
         Parameters:
             queue: A queue to store sequences of keypoints for further processing.
-            boost: An integer representing the boost factor for the counter.
+            boost: An integer factor; a sequence is sent every SEQUENCE_LENGTH * boost frames.
+            model_complexity: The Holistic pose landmark model to run, see KeypointsExtractor.
         """
-        self.keypoints_extractor = KeypointsExtractor()
+        self.keypoints_extractor = KeypointsExtractor(model_complexity=model_complexity)
         self.queue = queue
         self.boost = boost
+        self._push_interval = self.SEQUENCE_LENGTH * boost
+        self._put_sequence = queue.put_nowait
+
+    def new_sequence(self):
+        """
+        Creates an empty keypoints sequence that keeps only the most recent SEQUENCE_LENGTH frames.
+
+        Returns:
+            A KeypointsSequence of SEQUENCE_LENGTH frames.
+        """
+        return KeypointsSequence(self.SEQUENCE_LENGTH)
 
-    def update_frame_data(self, frame, counter, sequence):
+    def update_frame_data(self, frame, frame_index, sequence):
         """
         Updates the keypoints sequence with keypoints extracted from a new frame and manages the sequence length.
 
         Parameters:
             frame: The frame from which to extract keypoints.
-            counter: The current value of the counter.
-            sequence: The current sequence of keypoints.
+            frame_index: The number of frames processed so far.
+            sequence: The current sequence of keypoints, as created by new_sequence.
 
         Returns:
-            A tuple of the updated counter and keypoints sequence.
+            A tuple of the updated frame index and keypoints sequence.
         """
-        keypoints = self._extract_keypoints_from_frame(frame)
-        sequence.append(keypoints)
-        sequence = sequence[-self.SEQUENCE_LENGTH :]
-        counter = self._update_sequence_and_counter(sequence, counter)
-        return counter, sequence
+        # The keypoints go straight into the ring, overwriting the oldest frame
+        self._extract_keypoints_from_frame(frame, sequence.next_slot())
+        self._push_sequence_on_schedule(sequence, frame_index)
+        return frame_index + 1, sequence
 
-    def _extract_keypoints_from_frame(self, frame):
+    def extract_from_queue(self, frames_queue, stop_event):
+        """
+        Extracts keypoints from the frames put in a queue until the stop event is set. Meant to run in its own thread, so the webcam loop never waits for MediaPipe. The Holistic model is closed when the thread stops.
+
+        Parameters:
+            frames_queue: The queue the webcam puts the frames to process into.
+            stop_event: The threading.Event that signals the thread to stop.
+        """
+        sequence = self.new_sequence()
+        frame_index = 0
+        while not stop_event.is_set():
+            try:
+                frame = frames_queue.get(timeout=FRAME_WAIT_SECONDS)
+            except Empty:
+                continue
+            frame_index, sequence = self.update_frame_data(frame, frame_index, sequence)
+        self.keypoints_extractor.close()
+
+    def _extract_keypoints_from_frame(self, frame, out=None):
         """
         Extracts keypoints from the given frame using the KeypointsExtractor.
 
         Parameters:
             frame: The frame from which to extract keypoints.
+            out: An optional float32 array to write the keypoints into.
 
         Returns:
             A numpy array of extracted keypoints.
         """
         results = self.keypoints_extractor.detect_keypoints(frame)
-        keypoints = self.keypoints_extractor.extract_keypoints(results)
+        keypoints = self.keypoints_extractor.extract_keypoints(results, out)
         return keypoints
 
-    def _update_sequence_and_counter(self, sequence, counter):
+    def _push_sequence_on_schedule(self, sequence, frame_index):
         """
-        Manages the keypoints sequence and counter. If the sequence reaches the set length, it is added to the queue and the counter is reset.
+        Sends a snapshot of the keypoints sequence to the queue as a single array once it is full, every push interval frames.
+
+        The queue is bounded; if the classifier has fallen behind, the new sequence is dropped rather than the extraction thread waiting, so the sequences already queued are still classified in order.
 
         Parameters:
             sequence: The current keypoints sequence.
-            counter: The current value of the counter.
-
-        Returns:
-            The updated value of the counter.
-        """
-        if len(sequence) == self.SEQUENCE_LENGTH:
-            if counter == self.SEQUENCE_LENGTH * self.boost:
-                self.queue.put(sequence)
-                counter = 0
-            else:
-                counter += 1
-        return counter
+            frame_index: The index of the current frame.
+        """
+        if sequence.is_full() and frame_index % self._push_interval == 0:
+            try:
+                self._put_sequence(sequence.snapshot())
+            except Full:
+                logging.warning("Pose classification is behind, sequence dropped.")
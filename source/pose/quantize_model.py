@@ -0,0 +1,101 @@
+"""
+quantize_model.py
+
+This module converts the trained pose classification model to a quantized TFLite model. It rebuilds the Keras LSTM from its .h5 weights through PoseModel and converts it with TFLite's post-training quantization, either dynamic-range (int8 weights, no calibration data needed) or full-integer with a representative dataset of real keypoint sequences.
+
+Point files.model_path in the configuration at the generated .tflite file to classify poses with it. Run from the repository root:
+
+    PYTHONPATH=source python -m pose.quantize_model --output source/pose/final_model.tflite
+"""
+
+import argparse
+
+import numpy as np
+
+from pose.pose_classifier import PoseModel
+from utils import CONFIG_PATH, load_config
+
+# Number of sequences fed to the converter when calibrating int8 activations
+CALIBRATION_SAMPLES = 100
+
+
+def build_keras_model(config):
+    """
+    Rebuilds the Keras pose classification model from the configured weights.
+
+    Parameters:
+        config (dict): The application configuration.
+
+    Returns:
+        Sequential: The Keras model.
+    """
+    pose_config = config["pose_classification"]
+    pose_model = PoseModel(
+        config["files"]["model_path"],
+        pose_config["sequence_length"],
+        pose_config["actions"],
+    )
+    return pose_model.model
+
+
+def representative_dataset(sequences_path):
+    """
+    Builds the calibration generator for full-integer quantization.
+
+    Parameters:
+        sequences_path (str): A .npy file of keypoint sequences shaped (samples, sequence_length, input_dim).
+
+    Returns:
+        function: A generator function yielding single (1, sequence_length, input_dim) float32 sequences.
+    """
+    sequences = np.load(sequences_path).astype(np.float32, copy=False)
+
+    def generator():
+        for sequence in sequences[:CALIBRATION_SAMPLES]:
+            yield [sequence[np.newaxis]]
+
+    return generator
+
+
+def quantize(model, sequences_path=None):
+    """
+    Converts the Keras model to a quantized TFLite model.
+
+    Parameters:
+        model (Sequential): The Keras model to convert.
+        sequences_path (str, optional): Calibration sequences. When given, weights and activations are quantized to int8; otherwise only the weights are.
+
+    Returns:
+        bytes: The TFLite flatbuffer.
+    """
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if sequences_path is not None:
+        converter.representative_dataset = representative_dataset(sequences_path)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    return converter.convert()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Quantize the pose classification model to TFLite."
+    )
+    parser.add_argument(
+        "--output", required=True, help="Path of the .tflite file to write."
+    )
+    parser.add_argument(
+        "--calibration",
+        help="A .npy file of keypoint sequences for full-integer quantization.",
+    )
+    args = parser.parse_args()
+
+    model = build_keras_model(load_config(CONFIG_PATH))
+    with open(args.output, "wb") as file:
+        file.write(quantize(model, args.calibration))
+    print(f"Quantized model written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ thread_manager.py
 This module manages threading and inter-thread communication for the application. It provides a centralized way to manage threads, queues, and events which are crucial for orchestrating concurrent tasks.
 
 Classes:
+    DropOldestQueue: A bounded queue that makes room for a new item by dropping the oldest one.
     QueueManager: Manages queues for inter-thread communication.
     EventManager: Manages events for inter-thread synchronization.
     ThreadManager: Central manager for creating and controlling threads, and for handling queues and events.
@@ -11,10 +12,36 @@ Classes:
 
 import threading
 from queue import Empty
+from queue import Full
 from queue import Queue
+from queue import SimpleQueue
 import logging
 
 
+class DropOldestQueue(Queue):
+    """
+    A bounded queue whose put never blocks: when the queue is full, the oldest item is dropped to make room. Suited to streams where only the latest items matter, such as webcam frames.
+    """
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Puts an item into the queue, dropping the oldest item if the queue is full.
+
+        Parameters:
+            item (Any): The item to put.
+            block (bool): Unused; the put never blocks.
+            timeout (float or None): Unused; the put never blocks.
+        """
+        with self.not_full:
+            if 0 < self.maxsize <= self._qsize():
+                # The dropped item's slot is reused, so unfinished_tasks is unchanged
+                self._get()
+            else:
+                self.unfinished_tasks += 1
+            self._put(item)
+            self.not_empty.notify()
+
+
 class QueueManager:
     """
     Manages the creation, retrieval, and deletion of message queues.
@@ -26,24 +53,33 @@ class QueueManager:
         create_queue: Creates a new queue with a given name.
         get_queue: Retrieves a queue by its name.
         delete_queue: Deletes a queue by its name.
+        drain_queue: Discards every item waiting in a queue.
     """
 
     def __init__(self):
         """Initializes a new QueueManager object with an empty dictionary of queues."""
         self.queues = {}
 
-    def create_queue(self, name):
+    def create_queue(self, name, simple=False, maxsize=0, drop_oldest=False):
         """
         Creates a new queue with the specified name if it doesn't exist.
 
         Parameters:
             name (str): The name of the queue to create.
+            simple (bool): If true, creates a SimpleQueue, whose put never blocks. It lacks task_done/join and maxsize.
+            maxsize (int): The maximum number of items a Queue holds; 0 means unbounded. Ignored for a SimpleQueue.
+            drop_oldest (bool): If true, creates a DropOldestQueue of maxsize items.
 
         Returns:
-            Queue: The created or existing queue.
+            Queue or SimpleQueue: The created or existing queue.
         """
         if name not in self.queues:
-            self.queues[name] = Queue()
+            if simple:
+                self.queues[name] = SimpleQueue()
+            elif drop_oldest:
+                self.queues[name] = DropOldestQueue(maxsize)
+            else:
+                self.queues[name] = Queue(maxsize)
         return self.queues[name]
 
     def get_queue(self, name):
@@ -67,6 +103,22 @@ class QueueManager:
         """
         self.queues.pop(name, None)
 
+    def drain_queue(self, name):
+        """
+        Discards every item waiting in a queue by its name. The queue itself is kept, so threads holding a reference to it stay connected.
+
+        Parameters:
+            name (str): The name of the queue to drain.
+        """
+        target_queue = self.queues.get(name)
+        if target_queue is None:
+            return
+        while True:
+            try:
+                target_queue.get_nowait()
+            except Empty:
+                return
+
 
 class EventManager:
     """
@@ -108,8 +160,11 @@ class EventManager:
 
         Parameters:
             event_name (str): The name of the event to set.
+
+        Raises:
+            KeyError: If the event has not been created.
         """
-        self.events.get(event_name, threading.Event()).set()
+        self.events[event_name].set()
 
     def clear_event(self, event_name):
         """
@@ -117,8 +172,11 @@ class EventManager:
 
         Parameters:
             event_name (str): The name of the event to clear.
+
+        Raises:
+            KeyError: If the event has not been created.
         """
-        self.events.get(event_name, threading.Event()).clear()
+        self.events[event_name].clear()
 
     def is_event_set(self, event_name):
         """
@@ -129,8 +187,11 @@ class EventManager:
 
         Returns:
             bool: True if the event is set, False otherwise.
+
+        Raises:
+            KeyError: If the event has not been created.
         """
-        return self.events.get(event_name, threading.Event()).is_set()
+        return self.events[event_name].is_set()
 
     def get_event(self, event_name):
         """
@@ -154,8 +215,11 @@ class EventManager:
 
         Returns:
             bool: True if the event was set, False if a timeout occurred.
+
+        Raises:
+            KeyError: If the event has not been created.
         """
-        return self.events.get(event_name, threading.Event()).wait(timeout=timeout)
+        return self.events[event_name].wait(timeout=timeout)
 
 
 class ThreadManager:
@@ -172,9 +236,12 @@ class ThreadManager:
         get_thread_instance: Retrieves an instance of a thread by its name.
         start_thread: Starts a thread with a specified target function.
         stop_thread: Stops a thread by its name.
+        stop_threads: Stops several threads, signalling all of them before joining.
         is_thread_active: Checks if a thread is active.
         create_queue: Creates a queue with a specified name.
         get_queue: Retrieves a queue by its name.
+        delete_queue: Deletes a queue by its name.
+        drain_queue: Discards every item waiting in a queue.
         enqueue_message: Enqueues a message into a queue.
         dequeue_message: Dequeues a message from a queue.
         create_event: Creates an event with a specified name.
@@ -259,6 +326,24 @@ class ThreadManager:
 
         logging.info(f"Thread '{thread_name}' stopped.")
 
+    def stop_threads(self, thread_names):
+        """
+        Stops several threads by name. All stop events are set before any thread is joined, so the threads shut down concurrently.
+
+        Parameters:
+            thread_names (list): The names of the threads to stop.
+        """
+        running = [name for name in thread_names if name in self.threads]
+        for thread_name in running:
+            logging.info(f"Stopping thread '{thread_name}'...")
+            self.stop_events[thread_name].set()
+
+        for thread_name in running:
+            self.threads[thread_name].join()
+            del self.threads[thread_name]
+            del self.stop_events[thread_name]
+            logging.info(f"Thread '{thread_name}' stopped.")
+
     def is_thread_active(self, thread_name):
         """
         Checks if a specific thread is currently running.
@@ -271,17 +356,20 @@ class ThreadManager:
         """
         return thread_name in self.threads and self.threads[thread_name].is_alive()
 
-    def create_queue(self, queue_name):
+    def create_queue(self, queue_name, simple=False, maxsize=0, drop_oldest=False):
         """
         Creates a queue with the specified name.
 
         Parameters:
             queue_name (str): The name of the queue to create.
+            simple (bool): If true, creates a SimpleQueue instead of a Queue.
+            maxsize (int): The maximum number of items a Queue holds; 0 means unbounded.
+            drop_oldest (bool): If true, a full queue drops its oldest item instead of blocking.
 
         Returns:
-            Queue: The created queue.
+            Queue or SimpleQueue: The created queue.
         """
-        return self.queue_manager.create_queue(queue_name)
+        return self.queue_manager.create_queue(queue_name, simple, maxsize, drop_oldest)
 
     def get_queue(self, queue_name):
         """
@@ -295,17 +383,44 @@ class ThreadManager:
         """
         return self.queue_manager.get_queue(queue_name)
 
+    def delete_queue(self, queue_name):
+        """
+        Deletes a queue by its name.
+
+        Parameters:
+            queue_name (str): The name of the queue to delete.
+        """
+        self.queue_manager.delete_queue(queue_name)
+
+    def drain_queue(self, queue_name):
+        """
+        Discards every item waiting in a queue by its name.
+
+        Parameters:
+            queue_name (str): The name of the queue to drain.
+        """
+        self.queue_manager.drain_queue(queue_name)
+
     def enqueue_message(self, queue_name, message):
         """
-        Enqueues a message into a specified queue.
+        Enqueues a message into a specified queue without blocking.
 
         Parameters:
             queue_name (str): The name of the queue where to enqueue the message.
             message (Any): The message to enqueue.
+
+        Returns:
+            bool: True if the message was enqueued, False if the queue is missing or full.
         """
         target_queue = self.get_queue(queue_name)
-        if target_queue:
-            target_queue.put(message)
+        if target_queue is None:
+            return False
+        try:
+            target_queue.put_nowait(message)
+        except Full:
+            logging.warning(f"Queue '{queue_name}' is full, message dropped.")
+            return False
+        return True
 
     def dequeue_message(self, queue_name, timeout=None):
         """
@@ -2,19 +2,73 @@ import time
 import ddsp
 import librosa
 import numpy as np
+import soxr
+
+# Feature extraction settings, matching ddsp's compute_audio_features defaults
+SAMPLE_RATE = 16000
+FRAME_RATE = 250
+HOP_SIZE = SAMPLE_RATE // FRAME_RATE
+
+# Leading and trailing audio quieter than this (relative to the peak) is skipped
+SILENCE_TOP_DB = 40
+MIN_VOICED_SAMPLES = SAMPLE_RATE // 4
 
 
 class DDSPAudioProcessor:
+    _crepe_initialized = False
+
     @staticmethod
     def compute_features(audio):
         """Compute audio features."""
         start_time = time.time()
-        ddsp.spectral_ops.reset_crepe()
-        audio_features = ddsp.training.metrics.compute_audio_features(audio)
-        audio_features["loudness_db"] = audio_features["loudness_db"].astype(np.float32)
+        # Rebuilding CREPE is only needed once; later calls reuse the model
+        if not DDSPAudioProcessor._crepe_initialized:
+            ddsp.spectral_ops.reset_crepe()
+            DDSPAudioProcessor._crepe_initialized = True
+        start, end = DDSPAudioProcessor._find_voiced_range(audio)
+        audio_features = ddsp.training.metrics.compute_audio_features(
+            audio[:, start:end]
+        )
+        # Cast before padding so the padded arrays are built in float32 directly
+        for key in ["f0_hz", "f0_confidence", "loudness_db"]:
+            audio_features[key] = np.asarray(audio_features[key]).astype(
+                np.float32, copy=False
+            )
+        DDSPAudioProcessor._pad_features(
+            audio_features, audio.astype(np.float32, copy=False), start
+        )
         print(f"Audio features took {time.time() - start_time:.1f} seconds")
         return audio_features
 
+    @staticmethod
+    def _find_voiced_range(audio):
+        """Find the sample range between leading and trailing silence, aligned to frames."""
+        samples = audio[0]
+        _, (start, end) = librosa.effects.trim(
+            samples, top_db=SILENCE_TOP_DB, frame_length=2048, hop_length=512
+        )
+        start = start // HOP_SIZE * HOP_SIZE
+        end = min(len(samples), -(-end // HOP_SIZE) * HOP_SIZE)
+        if end - start < MIN_VOICED_SAMPLES:
+            return 0, len(samples)
+        return start, end
+
+    @staticmethod
+    def _pad_features(audio_features, audio, start):
+        """Pad features computed on the voiced range back to the full audio length."""
+        n_frames = audio.shape[1] // HOP_SIZE + 1
+        front = start // HOP_SIZE
+        silence = {
+            "f0_hz": 0.0,
+            "f0_confidence": 0.0,
+            "loudness_db": -ddsp.spectral_ops.DB_RANGE,
+        }
+        for key, value in silence.items():
+            feature = audio_features[key]
+            back = max(0, n_frames - front - len(feature))
+            audio_features[key] = np.pad(feature, (front, back), constant_values=value)
+        audio_features["audio"] = audio
+
     @staticmethod
     def trim_audio_features(audio_features, time_steps, n_samples):
         """Trim audio features to a given length."""
@@ -25,12 +79,14 @@ class DDSPAudioProcessor:
     @staticmethod
     def resample_audio(audio, orig_sr, target_sr):
         """Resample audio to target sampling rate."""
-        return librosa.resample(audio, orig_sr, target_sr, res_type="kaiser_best")
+        return soxr.resample(
+            audio.astype(np.float32, copy=False), orig_sr, target_sr, quality="HQ"
+        )
 
     @staticmethod
     def resynthesize(model, audio_features):
         """Use model to synthesize audio from features."""
         start_time = time.time()
-        outputs = model(audio_features, training=False)
+        audio = model.synthesize(audio_features)
         print(f"Prediction took {time.time() - start_time:.1f} seconds")
-        return model.get_audio_from_outputs(outputs).numpy()[0]
+        return audio.numpy()[0]
@@ -1,6 +1,9 @@
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import gin
+import numpy as np
+import tensorflow as tf
 
 from timbre_transfer.DDSP_audio_processor import DDSPAudioProcessor
 from timbre_transfer.DDSP_model_manager import ModelManager
@@ -144,40 +147,87 @@ class DDSPEngine:
             config_path (str): Path to the configuration file.
         """
         self._config = load_config(config_path)
+        self._configure_precision(self._config["morphing"].get("precision", "float32"))
         self._model_manager = ModelManager(self._config)
         self._audio_manager = DDSPAudioManager(self._config)
+        # Models are loaded on the calling thread; only their inference runs
+        # on this pool, one worker per model
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._model_manager.model_names)),
+            thread_name_prefix="ddsp",
+        )
 
-    def timbre_transfer(self):
-        """Transforms audio based on the configuration and models."""
+    def close(self):
+        """Shuts down the worker threads used for the per-model resynthesis."""
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _configure_precision(precision):
+        """Sets the Keras precision policy for the DDSP models.
+
+        Reduced precision only pays off on a GPU, so on CPU-only machines the
+        models are kept in float32 whatever the configuration says.
+
+        Args:
+            precision (str): A Keras policy name, e.g. "float32" or "mixed_float16".
+        """
+        if precision == "float32" or not tf.config.list_physical_devices("GPU"):
+            return
+        tf.keras.mixed_precision.set_global_policy(precision)
+
+    def timbre_transfer(self, audio=None):
+        """Transforms audio based on the configuration and models.
+
+        Args:
+            audio (ndarray, optional): Recorded audio already in memory. If None,
+                it is loaded from the audio folder.
+
+        Returns:
+            dict: Transformed audio keyed by the name of the file it is saved to.
+        """
         audio_folder = self._config["files"]["audio"]
-        audio = self._audio_manager.load_audio(audio_folder)
-        audio = self._audio_manager.resample_audio(
-            audio.ravel(), TARGET_SR, SR
-        ).reshape((1, -1))
+        if audio is None:
+            audio = self._audio_manager.load_audio(audio_folder)
+        # The resampler works on 1-D audio; adding the batch axis afterwards
+        # is a view, so the resampled array is never copied
+        audio = self._audio_manager.resample_audio(audio.ravel(), TARGET_SR, SR)
+        audio = audio[np.newaxis, :]
 
         audio_features = DDSPAudioProcessor.compute_features(audio)
 
+        # gin configuration is global, so features and models are prepared
+        # one model at a time; only the inference itself runs concurrently
+        jobs = []
         for index, name in enumerate(self._model_manager.model_names):
+            model_files = self._model_manager.get_model_files(index)
             audio_features_ = self._audio_manager.configure_audio_features(
-                audio, self._model_manager.get_model_files(index), audio_features
+                audio, model_files, audio_features
             )
-            processed_audio = self._process_with_model(index, name, audio_features_)
+            model = self._get_or_load_model(name, model_files, audio_features_)
+            jobs.append((model, audio_features_))
+
+        transformed_audio = {}
+        futures = [
+            self._executor.submit(self._process_with_model, model, audio_features_)
+            for model, audio_features_ in jobs
+        ]
+        for index, future in enumerate(futures):
+            processed_audio = future.result()
             save_audio(processed_audio, audio_folder, index)
+            transformed_audio[f"{index}.npy"] = processed_audio
+        return transformed_audio
 
-    def _process_with_model(self, index, name, audio_features):
+    def _process_with_model(self, model, audio_features):
         """Processes audio using a specific model.
 
         Args:
-            index (int): Index of the model.
-            name (str): Name of the model.
+            model (Model): Loaded DDSP model.
             audio_features (dict): Dictionary of audio features.
 
         Returns:
             ndarray: Processed audio data.
         """
         start_process_time = time.time()
-        model_files = self._model_manager.get_model_files(index)
-        model = self._get_or_load_model(name, model_files, audio_features)
         new_audio = self._audio_manager.resynthesize(model, audio_features)
         new_audio = self._audio_manager.resample_audio(new_audio, SR, TARGET_SR)
         print(f"Total time: {time.time() - start_process_time:.1f} seconds")
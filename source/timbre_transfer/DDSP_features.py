@@ -3,6 +3,9 @@ import librosa
 from ddsp.training.postprocessing import detect_notes, fit_quantile_transform
 import ddsp
 
+# Highest pitch a shifted f0 may reach (MIDI note 110)
+MAX_F0_HZ = librosa.midi_to_hz(110.0)
+
 
 class AudioFeatureModifier:
     """Modifies audio features based on provided configurations and statistics."""
@@ -80,7 +83,10 @@ class AudioFeatureModifier:
         Args:
             ld_shift (float): Amount by which to shift the loudness.
         """
-        self.audio_features["loudness_db"] += ld_shift
+        # A new array, for the same reason as in _shift_f0
+        self.audio_features["loudness_db"] = np.add(
+            self.audio_features["loudness_db"], ld_shift
+        )
 
     def _shift_f0(self, pitch_shift=0.0):
         """Shifts the pitch (f0) by a number of octaves.
@@ -88,10 +94,10 @@ class AudioFeatureModifier:
         Args:
             pitch_shift (float): Number of octaves by which to shift the pitch.
         """
-        self.audio_features["f0_hz"] *= 2.0 ** (pitch_shift)
-        self.audio_features["f0_hz"] = np.clip(
-            self.audio_features["f0_hz"], 0.0, librosa.midi_to_hz(110.0)
-        )
+        # The features are shared by every model, so the shifted pitch goes
+        # into a new array instead of scaling f0_hz in place
+        f0_hz = np.multiply(self.audio_features["f0_hz"], 2.0**pitch_shift)
+        self.audio_features["f0_hz"] = np.clip(f0_hz, 0.0, MAX_F0_HZ, out=f0_hz)
 
 
 class AudioFeatureConfig:
@@ -25,8 +25,12 @@ class ModelManager:
 
     def _model_files_from_directory(self, model_dir):
         """Retrieve paths for checkpoint, dataset stats, and gin config."""
-        ckpt_files = [f for f in tf.io.gfile.listdir(model_dir) if "ckpt" in f]
-        ckpt_name = ckpt_files[0].split(".")[0]
+        # Models live on the local disk, so a plain scandir is enough;
+        # stop at the first checkpoint file instead of listing them all
+        with os.scandir(model_dir) as entries:
+            ckpt_name = next(
+                entry.name.split(".")[0] for entry in entries if "ckpt" in entry.name
+            )
         ckpt = os.path.join(model_dir, ckpt_name)
         return {
             "dataset_stats_file": os.path.join(model_dir, "dataset_statistics.pkl"),
@@ -40,6 +44,14 @@ class ModelManager:
         model = ddsp.training.models.Autoencoder()
         model.restore(path["ckpt"])
         _ = model(audio_features, training=False)
+        # Run inference and audio extraction as one graph, so the outputs
+        # dict never round-trips to Python between the two steps
+        model.synthesize = tf.function(
+            lambda features: model.get_audio_from_outputs(
+                model(features, training=False)
+            ),
+            reduce_retracing=True,
+        )
         print(f"Restoring model took {time.time() - start_time:.1f} seconds")
         return model
 
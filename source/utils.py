@@ -1,16 +1,28 @@
+import functools
 import yaml
 import numpy as np
 import os
-import tensorflow as tf
 import pickle
-import soundfile as sf
+
+# libyaml's parser is several times faster; PyYAML builds without it only
+# have the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 CONFIG_PATH = "source/config/config.yml"
 
+# Full scale of 16-bit PCM; the recording is stored as int16 samples
+PCM16_SCALE = 32767.0
+
 
+# The controller, player, classifier, webcam and DDSP engine all read the
+# same file; parse it once and share the (read-only) result
+@functools.lru_cache(maxsize=None)
 def load_config(config_name):
     with open(config_name) as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=SafeLoader)
 
     return config
 
@@ -18,30 +30,45 @@ def load_config(config_name):
 def load_dataset_stats(dataset_stats_file):
     """Load dataset statistics from a pickle file."""
     try:
-        if tf.io.gfile.exists(dataset_stats_file):
-            with tf.io.gfile.GFile(dataset_stats_file, "rb") as f:
+        if os.path.exists(dataset_stats_file):
+            with open(dataset_stats_file, "rb") as f:
                 return pickle.load(f)
     except Exception as err:
         print(f"Loading dataset statistics from pickle failed: {err}.")
         return None
 
 
+def float32_to_pcm16(audio):
+    """Quantize float audio in [-1, 1] to int16 PCM samples."""
+    pcm = np.multiply(audio, PCM16_SCALE, dtype=np.float32)
+    np.clip(pcm, -PCM16_SCALE - 1, PCM16_SCALE, out=pcm)
+    return pcm.astype(np.int16)
+
+
+def pcm16_to_float32(audio):
+    """Return a new float32 copy of audio, scaling int16 PCM samples back to [-1, 1]."""
+    if audio.dtype == np.int16:
+        return np.multiply(audio, 1.0 / PCM16_SCALE, dtype=np.float32)
+    return np.array(audio, dtype=np.float32)
+
+
 def load_audio(audio_folder):
-    """Load audio from a numpy file."""
+    """Load the recorded audio from a numpy file as float32 samples."""
     file_path = os.path.join(audio_folder, "recorded_audio.npy")
-    return np.load(file_path, allow_pickle=True)
+    # The recording is a plain int16 array, so no pickle is involved; the
+    # mapping is read and converted in a single pass
+    return pcm16_to_float32(np.load(file_path, mmap_mode="r"))
 
 
-def save_audio(audio, folder, index, sample_rate=44100):
-    """Save audio to a numpy file and a wav file."""
+def save_audio(audio, folder, index):
+    """Save audio to a numpy file."""
 
     # Assicurati che la cartella esista
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
 
     # Costruisci il percorso base senza estensione
     base_path = os.path.join(folder, f"{index}")
 
     # Salva in formato .npy
     npy_path = f"{base_path}.npy"
-    np.save(npy_path, audio)
+    np.save(npy_path, np.asarray(audio, dtype=np.float32), allow_pickle=False)
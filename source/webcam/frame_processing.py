@@ -8,23 +8,39 @@ Classes:
 """
 
 import cv2
-from PyQt5 import QtGui, QtCore
+import numpy as np
+from PyQt5 import QtGui
+
+# Size of the box the displayed frame is fitted into, keeping its aspect ratio
+DISPLAY_WIDTH = 640
+DISPLAY_HEIGHT = 480
 
 
 class FrameDisplayProcessor:
     """
     Handles the processing and emission of frames for display.
 
-    This class is responsible for taking raw frames from a webcam feed, processing them, and then emitting them in a format that can be easily displayed by a GUI component. Processing includes converting the frame to the RGB color space, cropping, flipping, and scaling to the appropriate size for display.
+    This class is responsible for taking raw frames from a webcam feed, processing them, and then emitting them in a format that can be easily displayed by a GUI component. Processing includes mirroring and scaling the frame to the appropriate size for display in a single pass, then converting it to the 32-bit RGB layout Qt displays natively.
+
+    Attributes:
+        _transform: Cached 2x3 affine matrix and output size for the last seen frame size.
+        _warp_buffer: Reused array holding the mirrored and scaled BGR frame.
 
     Methods:
         emit_frame_for_display: Takes a raw frame, processes it, and emits it through a signal for display.
-        _prepare_frame_for_display: Prepares the frame by converting to RGB, cropping, flipping, and scaling.
-        _convert_frame_to_rgb: Converts a frame from BGR to RGB color space.
-        _crop_and_flip_frame: Crops and flips the frame horizontally.
-        _scale_frame: Scales the frame to a preset resolution.
+        _prepare_frame_for_display: Prepares the frame by mirroring, scaling, and converting to 32-bit RGB.
+        _mirror_and_scale_frame: Flips the frame horizontally and scales it with a single affine warp.
+        _convert_to_qimage: Converts a frame from BGR into a new 32-bit RGB QImage.
+        _get_transform: Computes the mirror-and-scale matrix for a frame size.
     """
 
+    def __init__(self):
+        """
+        Initializes the FrameDisplayProcessor with an empty frame buffer, allocated on the first frame.
+        """
+        self._transform = None
+        self._warp_buffer = None
+
     def emit_frame_for_display(self, frame, changePixmap):
         """
         Processes the frame and emits it for display.
@@ -40,9 +56,9 @@ class FrameDisplayProcessor:
 
     def _prepare_frame_for_display(self, frame):
         """
-        Prepares the frame by converting, cropping, flipping, and scaling.
+        Prepares the frame by mirroring, scaling, and converting it.
 
-        It sequentially calls internal methods to convert the frame to RGB format, crop and flip it, and finally scale it to the desired size.
+        The mirror and scale are done first in one warp, so the color conversion only touches the smaller display-sized frame.
 
         Parameters:
             frame: The raw frame to be processed.
@@ -50,53 +66,66 @@ class FrameDisplayProcessor:
         Returns:
             QImage: The processed Qt Image ready to be displayed.
         """
-        frame = self._convert_frame_to_rgb(frame)
-        frame = self._crop_and_flip_frame(frame)
-        return self._scale_frame(frame)
+        frame = self._mirror_and_scale_frame(frame)
+        return self._convert_to_qimage(frame)
 
-    def _convert_frame_to_rgb(self, frame):
+    def _mirror_and_scale_frame(self, frame):
         """
-        Converts the frame from BGR to RGB format.
+        Flips the frame horizontally and scales it to fit the display size, maintaining the aspect ratio.
 
-        This is necessary because OpenCV captures images in BGR format, but the display typically expects RGB format.
+        Flipping is commonly used in webcam applications to mirror the user's movements. Both steps are applied by a single cv2.warpAffine call into a buffer reused across frames.
 
         Parameters:
-            frame: The frame in BGR format to be converted.
+            frame: The frame to be mirrored and scaled.
 
         Returns:
-            ndarray: The frame converted to RGB format.
+            ndarray: The mirrored and scaled frame.
         """
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        h, w = frame.shape[:2]
+        matrix, size = self._get_transform(w, h)
+        self._warp_buffer = cv2.warpAffine(
+            frame, matrix, size, dst=self._warp_buffer, flags=cv2.INTER_LINEAR
+        )
+        return self._warp_buffer
 
-    def _crop_and_flip_frame(self, frame):
+    def _get_transform(self, w, h):
         """
-        Crops and horizontally flips the frame.
-
-        Flipping is commonly used in webcam applications to mirror the user's movements.
+        Returns the affine matrix that mirrors and scales a frame of the given size, computing it only when the size changes.
 
         Parameters:
-            frame: The frame to be cropped and flipped.
+            w: The frame width.
+            h: The frame height.
 
         Returns:
-            ndarray: The cropped and flipped frame.
+            tuple: The 2x3 float32 matrix and the (width, height) of the output.
         """
-        return cv2.flip(frame, 1)
-
-    def _scale_frame(self, frame):
+        if self._transform is None or self._transform[0] != (w, h):
+            scale = min(DISPLAY_WIDTH / w, DISPLAY_HEIGHT / h)
+            size = (round(w * scale), round(h * scale))
+            matrix = np.float32([[-scale, 0, scale * (w - 1)], [0, scale, 0]])
+            self._transform = ((w, h), matrix, size)
+        return self._transform[1], self._transform[2]
+
+    def _convert_to_qimage(self, frame):
         """
-        Scales the frame to the desired dimensions.
+        Converts the frame from BGR straight into the pixels of a new QImage.Format_RGB32 image.
 
-        This method converts the frame into a QImage and scales it, maintaining the aspect ratio, to a standard size for display.
+        On little-endian machines Format_RGB32 stores each pixel as B, G, R, 0xFF, which is exactly OpenCV's BGRA. It is also the native pixmap format, so the GUI thread can turn the image into a QPixmap without converting it. cv2.cvtColor writes into the image's own memory, so the conversion is the only pass over the pixels, and the image stays valid in the GUI thread while the next frame is processed.
 
         Parameters:
-            frame: The frame to be scaled.
+            frame: The frame in BGR format to be converted.
 
         Returns:
-            QImage: The scaled Qt Image with a fixed resolution.
+            QImage: The Qt Image holding the converted frame.
         """
-        h, w, ch = frame.shape
-        bytesPerLine = ch * w
-        qt_image = QtGui.QImage(
-            frame.data, w, h, bytesPerLine, QtGui.QImage.Format_RGB888
+        h, w = frame.shape[:2]
+        qt_image = QtGui.QImage(w, h, QtGui.QImage.Format_RGB32)
+        pixels = qt_image.bits()
+        pixels.setsize(qt_image.sizeInBytes())
+        # 32-bit rows are never padded, so the pixels are a plain h x w x 4 array
+        cv2.cvtColor(
+            frame,
+            cv2.COLOR_BGR2BGRA,
+            dst=np.frombuffer(pixels, np.uint8).reshape(h, w, 4),
         )
-        return qt_image.scaled(640, 480, QtCore.Qt.KeepAspectRatio)
+        return qt_image
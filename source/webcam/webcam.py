@@ -8,6 +8,9 @@ Classes:
     Webcam: Extends QtCore.QThread to manage the webcam capture and frame processing in a separate thread.
 """
 
+import logging
+import threading
+import time
 from pose.pose_estimation import KeypointsProcessor
 from webcam.frame_processing import FrameDisplayProcessor
 import cv2
@@ -15,6 +18,27 @@ from PyQt5 import QtCore
 from utils import CONFIG_PATH, load_config
 from PyQt5.QtCore import pyqtSignal
 
+# How long to wait before retrying after the webcam returns no frame
+READ_RETRY_SECONDS = 0.01
+
+# Capture format requested from the webcam; the display never shows more
+# than 640x480 and keypoint detection runs on an even smaller copy
+CAPTURE_WIDTH = 640
+CAPTURE_HEIGHT = 480
+CAPTURE_FPS = 30
+
+# Frames the driver may hold; with one, a grab always returns the newest frame
+CAPTURE_BUFFER_SIZE = 1
+
+# Frames waiting for keypoints extraction; older ones are dropped, so the
+# keypoints always follow the latest frame
+EXTRACTION_QUEUE_SIZE = 1
+
+# Keypoints sequences waiting for pose classification. One is sent every few
+# seconds and classified in milliseconds, so a backlog means the classifier
+# has stalled; new sequences are dropped rather than piling up
+SEQUENCE_QUEUE_SIZE = 2
+
 
 class WebcamCapture:
     """
@@ -23,7 +47,8 @@ class WebcamCapture:
 
     Methods:
         initialize: Starts the video capture for the default webcam.
-        read_frame: Reads a frame from the webcam.
+        grab_frame: Grabs the next frame from the webcam without decoding it.
+        retrieve_frame: Decodes the last grabbed frame.
         release: Releases the webcam device.
     """
 
@@ -33,24 +58,46 @@ class WebcamCapture:
 
     def initialize(self):
         """
-        Starts the video capture for the default webcam.
+        Starts the video capture for the default webcam, asking for a CAPTURE_WIDTH x CAPTURE_HEIGHT stream at CAPTURE_FPS.
+
+        Cameras that do not support the requested format keep their closest native mode. The driver buffer is shrunk to CAPTURE_BUFFER_SIZE frames, so frames are not read seconds after they were taken.
 
         Returns:
             cv2.VideoCapture: The video capture object.
         """
-        return cv2.VideoCapture(0)
+        cap = cv2.VideoCapture(0)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
+        cap.set(cv2.CAP_PROP_FPS, CAPTURE_FPS)
+        if not cap.set(cv2.CAP_PROP_BUFFERSIZE, CAPTURE_BUFFER_SIZE):
+            logging.warning(
+                "The webcam backend does not support setting the buffer size."
+            )
+        return cap
+
+    def grab_frame(self, cap):
+        """
+        Grabs the next frame from the webcam, keeping its queue drained, without decoding it.
+
+        Parameters:
+            cap: The video capture object from which to grab.
+
+        Returns:
+            bool: True if a frame was grabbed.
+        """
+        return cap.grab()
 
-    def read_frame(self, cap):
+    def retrieve_frame(self, cap):
         """
-        Reads a frame from the webcam.
+        Decodes the last grabbed frame.
 
         Parameters:
-            cap: The video capture object from which to read.
+            cap: The video capture object from which to retrieve.
 
         Returns:
-            ndarray or None: The captured frame, or None if no frame is captured.
+            ndarray or None: The decoded frame, or None if it could not be decoded.
         """
-        ret, frame = cap.read()
+        ret, frame = cap.retrieve()
         return frame if ret else None
 
     def release(self, cap):
@@ -73,44 +120,56 @@ class Webcam(QtCore.QThread):
         is_running: Boolean indicating if the webcam thread is running.
         thread_manager: Reference to the manager that handles threading events and queues.
         keypoints_queue: Queue for storing keypoints data from the processed frames.
-        frame_callback: The callback function to be executed with each new frame.
+        frames_queue: Bounded queue of frames waiting for keypoints extraction.
         config: Loaded configuration settings.
         boost: Configuration setting for latency factor in pose classification.
         webcam: WebcamCapture instance to manage webcam operations.
         keypoints_processor: KeypointsProcessor instance to process keypoints from frames.
         display_processor: FrameDisplayProcessor instance to prepare frames for display.
+        display_period: Minimum time in seconds between two frames sent for display.
+        _display_ready: Event set once the GUI thread has painted the last emitted frame.
 
     Methods:
         __init__: Constructor to initialize the Webcam thread.
         _load_config: Loads configuration settings from a file.
         run: Main entry point for the QThread.
         _process_frames: Processes frames from the webcam in real-time.
+        _should_display: Decides whether the current frame should be sent for display.
+        frame_displayed: Marks the last emitted frame as painted, allowing the next one to be sent.
         stop: Signals the thread to stop running.
     """
 
     newFrameSignal = pyqtSignal(object)
 
-    def __init__(self, thread_manager, frame_callback, parent=None):
+    def __init__(self, thread_manager, parent=None):
         """
         Initializes the Webcam object with necessary components and state variables.
 
         Parameters:
             thread_manager: The ThreadManager object managing threading events and queues.
-            frame_callback: The callback function to execute for each frame.
             parent: The parent QObject, if any (default is None).
         """
         super(Webcam, self).__init__(parent=parent)
         self.is_running = True
         self.thread_manager = thread_manager
-        self.keypoints_queue = self.thread_manager.queue_manager.create_queue(
-            "keypoints_data"
+        self.keypoints_queue = self.thread_manager.create_queue(
+            "keypoints_data", maxsize=SEQUENCE_QUEUE_SIZE
+        )
+        self.frames_queue = self.thread_manager.create_queue(
+            "keypoints_frames", maxsize=EXTRACTION_QUEUE_SIZE, drop_oldest=True
         )
-        self.frame_callback = frame_callback
         self.config = self._load_config()
         self.boost = self.config["pose_classification"]["latency_factor"]
         self.webcam = WebcamCapture()
-        self.keypoints_processor = KeypointsProcessor(self.keypoints_queue, self.boost)
+        self.keypoints_processor = KeypointsProcessor(
+            self.keypoints_queue,
+            self.boost,
+            self.config["pose_estimation"]["model_complexity"],
+        )
         self.display_processor = FrameDisplayProcessor()
+        self.display_period = 1.0 / self.config["webcam"]["display_fps"]
+        self._display_ready = threading.Event()
+        self._display_ready.set()
 
     def _load_config(self):
         """
@@ -130,6 +189,12 @@ class Webcam(QtCore.QThread):
         """
 
         cap = self.webcam.initialize()
+        # MediaPipe runs in its own thread, stopped with the others on close
+        self.thread_manager.start_thread(
+            "keypoints_extraction",
+            self.keypoints_processor.extract_from_queue,
+            args=(self.frames_queue,),
+        )
         self._process_frames(cap, stop_event)
         self.webcam.release(cap)
 
@@ -141,22 +206,73 @@ class Webcam(QtCore.QThread):
             cap: The video capture object from which to read frames.
             stop_event: The threading.Event that signals the thread to stop.
         """
-        sequence = []
-        counter = 0
-        self.thread_manager.create_event("start_extraction")
+        last_display_time = 0.0
+        # The event is looked up once rather than by name on every frame
+        extraction_event = self.thread_manager.create_event("start_extraction")
 
         while self.is_running and cap.isOpened():
             if stop_event.is_set():
                 break
 
-            frame = self.webcam.read_frame(cap)
-            if frame is not None:
-                if self.thread_manager.is_event_set("start_extraction"):
-                    counter, sequence = self.keypoints_processor.update_frame_data(
-                        frame, counter, sequence
-                    )
-            processed_frame = self.display_processor._prepare_frame_for_display(frame)
-            self.newFrameSignal.emit(processed_frame)
+            if not self.webcam.grab_frame(cap):
+                # Back off instead of spinning while the webcam has no frame
+                stop_event.wait(READ_RETRY_SECONDS)
+                continue
+
+            # A frame is only decoded for extraction once the extraction thread
+            # has taken the previous one, and for display only as often as the
+            # GUI can paint; a frame needed by neither is grabbed but never
+            # decoded, which keeps the driver buffer drained
+            extracting = extraction_event.is_set() and self.frames_queue.empty()
+            now = time.perf_counter()
+            displaying = self._should_display(now, last_display_time)
+            if not (extracting or displaying):
+                continue
+
+            frame = self.webcam.retrieve_frame(cap)
+            if frame is None:
+                continue
+
+            if extracting:
+                # Never blocks: should a frame still be waiting, it is replaced
+                self.frames_queue.put(frame)
+
+            if displaying:
+                last_display_time = now
+                self._display_ready.clear()
+                processed_frame = self.display_processor._prepare_frame_for_display(
+                    frame
+                )
+                self.newFrameSignal.emit(processed_frame)
+
+    def _should_display(self, now, last_display_time):
+        """
+        Decides whether the current frame should be sent for display.
+
+        A frame is skipped if the display rate would be exceeded, or if the GUI thread has not yet painted the previous frame.
+
+        Parameters:
+            now: The current time from time.perf_counter.
+            last_display_time: The time the last frame was sent for display.
+
+        Returns:
+            bool: True if the frame should be displayed.
+        """
+        return (
+            now - last_display_time >= self.display_period
+            and self._display_ready.is_set()
+        )
+
+    def frame_displayed(self, _frame=None):
+        """
+        Marks the last emitted frame as painted, allowing the next one to be sent.
+
+        Connect it to newFrameSignal after the display slot: slots run in connection order, so the flag is only released once the frame is on screen, and at most one frame is ever queued for the GUI thread.
+
+        Parameters:
+            _frame: The delivered frame (unused).
+        """
+        self._display_ready.set()
 
     def stop(self):
         """